@@ -3,11 +3,12 @@ sys.dont_write_bytecode = True
 
 from starlette.applications import Starlette
 from starlette.routing import Route
-from starlette.responses import JSONResponse
+from starlette.responses import Response, JSONResponse, PlainTextResponse, HTMLResponse
 import os
 import importlib.util
 import inspect
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from typing import List
 
@@ -19,15 +20,88 @@ def sync(func):
     func._onramp_sync = True
     return func
 
+def fast(func):
+    """Decorator to run a 'def' handler directly on the event loop, skipping the thread pool.
+
+    Only for handlers that never block (no I/O, no sleeping, no heavy CPU):
+    while one runs, no other request is served.
+    """
+    func._onramp_fast = True
+    return func
+
+# HTTP methods a route module can handle, with the function name for each
+_HTTP_METHODS = tuple((method, method.lower())
+                      for method in ('GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS'))
+
+# Route files whose path isn't just /api/<name>
+_SPECIAL_ROUTE_PATHS = {'index': '/api'}
+
+# [id] in a route file name becomes Starlette's {id}
+_BRACKETS_TO_BRACES = str.maketrans('[]', '{}')
+
+# Route modules already executed, as absolute path -> (mtime, module); an
+# edited file replaces its entry
+_ROUTE_MODULES = {}
+
+def _text_response(result):
+    """Strings that look like HTML are served as HTML, anything else as plain text"""
+    # lstrip/rstrip hand back result itself unless there is whitespace to drop
+    if result.lstrip().startswith('<') and result.rstrip().endswith('>'):
+        return HTMLResponse(result)
+    return PlainTextResponse(result)
+
+# Response builders for the common return types, looked up by exact type so
+# the usual case skips _convert_response's isinstance chain
+_RESPONSE_CONVERTERS = {
+    dict: JSONResponse,
+    list: JSONResponse,
+    tuple: JSONResponse,
+    int: JSONResponse,
+    float: JSONResponse,
+    bool: JSONResponse,
+    str: _text_response,
+    type(None): lambda result: PlainTextResponse(""),
+}
+
+def _worker_count():
+    """Thread pool size from ONRAMP_WORKERS, or 4 threads per CPU (at most 32)"""
+    default = min(32, (os.cpu_count() or 1) * 4)
+    value = os.environ.get('ONRAMP_WORKERS')
+    if not value:
+        return default
+    try:
+        workers = int(value)
+    except ValueError:
+        workers = 0
+    if workers < 1:
+        print(f"Warning: ONRAMP_WORKERS must be a positive integer, got {value!r}; using {default}")
+        return default
+    return workers
+
+def _param_count(func):
+    """Number of parameters a handler takes; called once per handler, when its route is built"""
+    if inspect.isfunction(func) and not (hasattr(func, '__wrapped__') or hasattr(func, '__signature__')):
+        # A plain function: read the count straight off its code object
+        code = func.__code__
+        return (code.co_argcount + code.co_kwonlyargcount
+                + bool(code.co_flags & inspect.CO_VARARGS)
+                + bool(code.co_flags & inspect.CO_VARKEYWORDS))
+    return len(inspect.signature(func).parameters)
+
 class OnRamp:
     """
     OnRamp is an async-by-default web framework.
     All route handlers are automatically treated as async, even if defined with 'def'.
-    Use @sync decorator for intentionally synchronous handlers.
+    Use @sync decorator for intentionally synchronous handlers, and @fast for
+    trivial non-blocking 'def' handlers that can skip the thread pool.
+    Synchronous handlers run in a thread pool sized by ONRAMP_WORKERS
+    (default: 4 threads per CPU, at most 32).
     """
     
     def __init__(self, app_dir=None):
         self.routes: List[Route] = []
+        self._workers = _worker_count()
+        self._executor = None  # created on first use, dropped on shutdown
         # Allow explicit app_dir to be passed, otherwise discover it
         self.app_dir = app_dir or self._find_app_directory()
         
@@ -79,27 +153,33 @@ class OnRamp:
         if self.app_dir not in sys.path:
             sys.path.insert(0, self.app_dir)
         
-        for filename in os.listdir(api_dir):
-            if filename.endswith('.py') and not filename.startswith('__'):
-                self._load_route_file(filename, api_dir)
+        # scandir's entries carry their file type, so no extra stat per file
+        with os.scandir(api_dir) as entries:
+            route_files = [(entry.name, entry.path) for entry in entries
+                           if entry.name.endswith('.py') and not entry.name.startswith('__') and entry.is_file()]
+
+        # Starlette matches routes in order: register static paths before
+        # dynamic ones so /api/{id} can't swallow /api/users, and sort by
+        # name so the table doesn't depend on directory order
+        route_files.sort(key=lambda f: ('[' in f[0], f[0]))
+        for filename, file_path in route_files:
+            self._load_route_file(filename, api_dir, file_path)
     
     def _convert_response(self, result):
         """Convert Python returns to appropriate HTTP responses (Flask-style)"""
-        from starlette.responses import PlainTextResponse, HTMLResponse
-        
+        converter = _RESPONSE_CONVERTERS.get(type(result))
+        if converter is not None:
+            return converter(result)
+
         # Return Response objects as-is
-        if hasattr(result, 'status_code'):
+        if isinstance(result, Response):
             return result
             
         # Convert common Python types to appropriate responses
         if isinstance(result, dict):
             return JSONResponse(result)
         elif isinstance(result, str):
-            # Check if it looks like HTML
-            if result.strip().startswith('<') and result.strip().endswith('>'):
-                return HTMLResponse(result)
-            else:
-                return PlainTextResponse(result)
+            return _text_response(result)
         elif isinstance(result, (list, tuple)):
             # Convert lists/tuples to JSON
             return JSONResponse(result)
@@ -113,148 +193,151 @@ class OnRamp:
             return PlainTextResponse(str(result))
     
     def _make_async_handler(self, handler_func):
-        """Convert a sync handler to async, or wrap async handler safely"""
-        
-        # Get the function signature to determine what parameters it expects
-        sig = inspect.signature(handler_func)
-        param_count = len(sig.parameters)
-        
-        # Check if explicitly marked as sync
-        if getattr(handler_func, '_onramp_sync', False):
-            # Wrap sync function to run in thread pool
-            @wraps(handler_func)
-            async def sync_wrapper(request, params=None):
-                loop = asyncio.get_event_loop()
-                
-                # Call with appropriate number of arguments
-                if param_count == 0:
-                    result = await loop.run_in_executor(None, lambda: handler_func())
-                elif param_count == 1:
-                    result = await loop.run_in_executor(None, lambda: handler_func(request))
-                else:
-                    result = await loop.run_in_executor(None, lambda: handler_func(request, params))
-                
-                return self._convert_response(result)
-            return sync_wrapper
-        
-        # Check if already async
-        if inspect.iscoroutinefunction(handler_func):
-            # Already async, just wrap with response conversion
-            @wraps(handler_func)
-            async def async_wrapper(request, params=None):
-                # Call with appropriate number of arguments
-                if param_count == 0:
-                    result = await handler_func()
-                elif param_count == 1:
-                    result = await handler_func(request)
-                else:
-                    result = await handler_func(request, params)
-                
-                return self._convert_response(result)
-            return async_wrapper
-        
-        # Regular function - make it async by default
-        @wraps(handler_func)
-        async def default_async_wrapper(request, params=None):
-            # Run sync function in thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            
-            # Call with appropriate number of arguments
+        """Convert a sync handler to async, or wrap async handler safely.
+
+        Everything that is fixed per handler (sync or async, how many
+        arguments it takes) is decided here, so the returned wrapper does
+        no introspection or branching per request. The wrapper is a plain
+        Starlette endpoint; two-argument handlers get the path params.
+
+        Returns (wrapper, kind), kind being "fast", "sync", "auto-async" or
+        "async" for the registration log.
+        """
+        param_count = _param_count(handler_func)
+        convert = self._convert_response
+        executor = self._get_executor
+
+        is_async = inspect.iscoroutinefunction(handler_func)
+        is_sync = getattr(handler_func, '_onramp_sync', False)
+
+        # @fast 'def' handlers are called inline: no thread pool round trip
+        if getattr(handler_func, '_onramp_fast', False) and not (is_async or is_sync):
+            kind = 'fast'
             if param_count == 0:
-                result = await loop.run_in_executor(None, lambda: handler_func())
+                async def wrapper(request):
+                    return convert(handler_func())
             elif param_count == 1:
-                result = await loop.run_in_executor(None, lambda: handler_func(request))
+                async def wrapper(request):
+                    return convert(handler_func(request))
             else:
-                result = await loop.run_in_executor(None, lambda: handler_func(request, params))
-            
-            return self._convert_response(result)
-        return default_async_wrapper
+                async def wrapper(request):
+                    return convert(handler_func(request, request.path_params))
+
+        # @sync and regular 'def' handlers run in the thread pool so they
+        # don't block the event loop
+        elif is_sync or not is_async:
+            kind = 'sync' if is_sync else 'auto-async'
+            if param_count == 0:
+                async def wrapper(request):
+                    loop = asyncio.get_running_loop()
+                    return convert(await loop.run_in_executor(executor(), handler_func))
+            elif param_count == 1:
+                async def wrapper(request):
+                    loop = asyncio.get_running_loop()
+                    return convert(await loop.run_in_executor(executor(), handler_func, request))
+            else:
+                async def wrapper(request):
+                    loop = asyncio.get_running_loop()
+                    return convert(await loop.run_in_executor(executor(), handler_func, request, request.path_params))
+
+        # Already async, just wrap with response conversion
+        else:
+            kind = 'async'
+            if param_count == 0:
+                async def wrapper(request):
+                    return convert(await handler_func())
+            elif param_count == 1:
+                async def wrapper(request):
+                    return convert(await handler_func(request))
+            else:
+                async def wrapper(request):
+                    return convert(await handler_func(request, request.path_params))
+
+        return wraps(handler_func)(wrapper), kind
+
+    def _get_executor(self):
+        """The thread pool for sync handlers, created on first use"""
+        executor = self._executor
+        if executor is None:
+            executor = self._executor = ThreadPoolExecutor(max_workers=self._workers,
+                                                           thread_name_prefix='onramp')
+        return executor
+
+    def _shutdown_executor(self):
+        """Shut the thread pool down; the next sync request starts a new one"""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            # Let in-flight sync handlers finish, but don't hold up shutdown for them
+            executor.shutdown(wait=False)
     
-    def _load_route_file(self, filename, api_dir):
+    def _load_route_file(self, filename, api_dir, file_path=None):
         """Load a single route file and register its handlers"""
         module_name = filename[:-3]  # Remove .py extension
-        file_path = os.path.join(api_dir, filename)
+        file_path = file_path or os.path.join(api_dir, filename)
         
         try:
-            # Create a unique module name to avoid conflicts
-            unique_module_name = f"api_{module_name}_{id(self)}"
-            
-            # Dynamically import the module
-            spec = importlib.util.spec_from_file_location(unique_module_name, file_path)
-            if spec is None:
-                print(f"Could not create spec for {file_path}")
-                return
-                
-            module = importlib.util.module_from_spec(spec)
-            
-            # Add to sys.modules to make imports work correctly
-            sys.modules[unique_module_name] = module
-            
-            try:
-                spec.loader.exec_module(module)
-            except Exception as e:
-                # Clean up on failure
-                if unique_module_name in sys.modules:
-                    del sys.modules[unique_module_name]
-                raise e
+            # Reuse the module if this exact file was loaded before (another
+            # create_app() in the same process); an edit changes the mtime
+            abs_path = os.path.abspath(file_path)
+            mtime_ns = os.stat(file_path).st_mtime_ns
+            cached_mtime_ns, module = _ROUTE_MODULES.get(abs_path, (None, None))
+            if cached_mtime_ns != mtime_ns:
+                # Create a unique module name to avoid conflicts
+                unique_module_name = f"api_{module_name}_{id(self)}"
+
+                # Dynamically import the module
+                spec = importlib.util.spec_from_file_location(unique_module_name, file_path)
+                if spec is None:
+                    print(f"Could not create spec for {file_path}")
+                    return
+
+                module = importlib.util.module_from_spec(spec)
+
+                # Add to sys.modules to make imports work correctly
+                sys.modules[unique_module_name] = module
+
+                try:
+                    spec.loader.exec_module(module)
+                except Exception as e:
+                    # Clean up on failure
+                    if unique_module_name in sys.modules:
+                        del sys.modules[unique_module_name]
+                    raise e
+                _ROUTE_MODULES[abs_path] = (mtime_ns, module)
             
             # Determine the route path from filename with /api prefix
-            if module_name == 'index':
-                route_path = "/api"
-            else:
-                route_path = f"/api/{module_name}"
-            
-            # Check for dynamic route (contains brackets)
             if '[' in module_name and ']' in module_name:
-                # Convert [id] to {id} for Starlette path parameters
-                route_path = module_name.replace('[', '{').replace(']', '}')
-                route_path = f"/api/{route_path}"
+                # Dynamic route: convert [id] to {id} for Starlette path parameters
+                route_path = f"/api/{module_name.translate(_BRACKETS_TO_BRACES)}"
+            else:
+                route_path = _SPECIAL_ROUTE_PATHS.get(module_name) or f"/api/{module_name}"
             
             # Find HTTP method handlers in the module
-            supported_methods = []
             handlers = {}
+            kinds = {}
             
-            for method in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
-                method_lower = method.lower()
-                if hasattr(module, method_lower):
-                    handler_func = getattr(module, method_lower)
-                    if callable(handler_func):
-                        supported_methods.append(method)
-                        # Convert to async handler
-                        handlers[method] = self._make_async_handler(handler_func)
+            namespace = vars(module)
+            for method, name in _HTTP_METHODS:
+                handler_func = namespace.get(name)
+                if callable(handler_func):
+                    # Convert to async handler
+                    handlers[method], kinds[method] = self._make_async_handler(handler_func)
             
             if handlers:
-                # Create a unified handler that routes to appropriate method
-                async def unified_handler(request):
-                    method = request.method
-                    if method in handlers:
-                        handler = handlers[method]
-                        
-                        # Prepare parameters
-                        params = request.path_params if request.path_params else {}
-                        
-                        # All handlers are now async, so we can always await
-                        return await handler(request, params)
-                    else:
-                        return JSONResponse(
-                            {"error": f"Method {method} not allowed"}, 
-                            status_code=405
-                        )
-                
-                self.routes.append(Route(route_path, unified_handler, methods=supported_methods))
+                # One route per file, so a 405's Allow header lists every method
+                # the file handles. Without a head() handler, HEAD is served by
+                # GET, as Starlette does for its own GET routes.
+                if 'GET' in handlers:
+                    handlers.setdefault('HEAD', handlers['GET'])
+
+                async def dispatch(request, handlers=handlers):
+                    # The route only accepts methods in handlers
+                    return await handlers[request.method](request)
+
+                self.routes.append(Route(route_path, dispatch, methods=list(handlers)))
                 
                 # Show which handlers are sync vs async for debugging
-                handler_info = []
-                for method in supported_methods:
-                    method_lower = method.lower()
-                    original_handler = getattr(module, method_lower)
-                    if getattr(original_handler, '_onramp_sync', False):
-                        handler_info.append(f"{method}(sync)")
-                    elif inspect.iscoroutinefunction(original_handler):
-                        handler_info.append(f"{method}(async)")
-                    else:
-                        handler_info.append(f"{method}(auto-async)")
-                
+                handler_info = [f"{method}({kind})" for method, kind in kinds.items()]
                 print(f"Registered route: {route_path} -> {filename} [{', '.join(handler_info)}]")
             else:
                 print(f"Warning: No HTTP method handlers found in {filename}")
@@ -268,6 +351,7 @@ class OnRamp:
         """Create the Starlette application"""
         self.discover_file_routes()
         app = Starlette(routes=self.routes)
+        app.add_event_handler("shutdown", self._shutdown_executor)
         
         # Register database with the app for auto startup/shutdown
         register_db_with_app(app, self.app_dir)
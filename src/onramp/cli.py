@@ -15,7 +15,8 @@ import signal
 import atexit
 from watchfiles import watch
 from .db.migrations import create_migration, migrate, init_migrations
-from .rn_app import create_react_native_app
+from .rn_app import (create_react_native_app, FEATURES, NPM_INSTALL_FLAGS, current_node_version,
+                     node_version_output, semver_tuple)
 from types import SimpleNamespace
 import re
 
@@ -29,25 +30,14 @@ SETTINGS_PATH = os.path.join(APP_DIR, 'settings.py')
 
 MIN_NODE = "20.19.4"  # keep your RN minimum here
 
-def _semver_tuple(s: str):
-    m = re.match(r"^v?(\d+)\.(\d+)\.(\d+)", s.strip())
-    return tuple(map(int, m.groups())) if m else (0, 0, 0)
-
-def _current_node_version():
-    try:
-        out = subprocess.run(["node", "-v"], text=True, capture_output=True, check=True).stdout
-        return _semver_tuple(out)
-    except Exception:
-        return (0, 0, 0)
-
 def ensure_node_env(min_required: str = MIN_NODE, track_major: str = "20"):
     """
     Guarantee Node >= min_required and prefer the latest track_major.x via nvm.
     Returns an env dict with PATH pointing to the selected node/npm so all
     subprocesses use it.
     """
-    cur = _current_node_version()
-    if cur >= _semver_tuple(min_required):
+    cur = current_node_version()
+    if cur >= semver_tuple(min_required):
         # Already good enough; just return current env
         return os.environ.copy()
 
@@ -69,7 +59,8 @@ def ensure_node_env(min_required: str = MIN_NODE, track_major: str = "20"):
       echo NPM_BIN:$(command -v npm)
       node --version
     '''
-    res = subprocess.run(["bash", "-lc", script], text=True, capture_output=True)
+    # nvm.sh is sourced explicitly, so a login shell (-l) is not needed
+    res = subprocess.run(["bash", "-c", script], text=True, capture_output=True)
     if res.returncode != 0:
         print("Failed to switch Node with nvm. Output:\n", res.stdout or res.stderr)
         return os.environ.copy()
@@ -232,9 +223,10 @@ def _ensure_rn_cli_deps(build_dir: str, env: dict):
             print("Adding React Native CLI devDependencies:", ", ".join(missing))
             subprocess.run(
                 ["npm", "i", "-D",
-                 "@react-native-community/cli@^20.0.2",
-                 "@react-native-community/cli-platform-ios@^20.0.2",
-                 "@react-native-community/cli-platform-android@^20.0.2"],
+                 "@react-native-community/cli@20.0.2",
+                 "@react-native-community/cli-platform-ios@20.0.2",
+                 "@react-native-community/cli-platform-android@20.0.2",
+                 *NPM_INSTALL_FLAGS],
                 cwd=build_dir, check=True, env=env
             )
     except Exception as e:
@@ -256,9 +248,9 @@ def ensure_ios_pods(ios_dir: str, env: dict):
         print("`pod install` failed. Common causes:")
         print(" - Missing @react-native-community/cli devDependencies")
         print(" - Ruby/CocoaPods setup issues")
-        print("Try: `cd build && npm i -D @react-native-community/cli@^20 "
-              "@react-native-community/cli-platform-ios@^20 "
-              "@react-native-community/cli-platform-android@^20`")
+        print("Try: `cd build && npm i -D @react-native-community/cli@20.0.2 "
+              "@react-native-community/cli-platform-ios@20.0.2 "
+              "@react-native-community/cli-platform-android@20.0.2`")
         print("Then: `cd build/ios && pod install`")
     else:
         print("✓ iOS dependencies installed")
@@ -286,13 +278,14 @@ def ensure_native_projects(custom_env=None, project_name: str | None = None):
     root_basename = os.path.basename(PROJECT_ROOT)
     native_name = to_rn_project_name(project_name or root_basename)
 
+    # Make sure CLI dev deps are present for autolinking. If they were missing,
+    # `npm i -D` has already installed everything, so the install below is skipped.
+    _ensure_rn_cli_deps(BUILD_DIR, env)
+
     build_pkg = os.path.join(BUILD_DIR, 'package.json')
     if os.path.exists(build_pkg) and not os.path.exists(os.path.join(BUILD_DIR, 'node_modules')):
         print("Installing npm dependencies...")
-        subprocess.run(['npm', 'install', '--legacy-peer-deps'], cwd=BUILD_DIR, check=True, env=env)
-
-    # Make sure CLI dev deps are present for autolinking
-    _ensure_rn_cli_deps(BUILD_DIR, env)
+        subprocess.run(['npm', 'install', *NPM_INSTALL_FLAGS], cwd=BUILD_DIR, check=True, env=env)
 
     temp_dir = os.path.join(PROJECT_ROOT, 'temp_rn_init')
     try:
@@ -325,22 +318,7 @@ def ensure_native_projects(custom_env=None, project_name: str | None = None):
         write_nvmrc(PROJECT_ROOT)
 
         # iOS pods on macOS
-        if platform.system() == "Darwin" and os.path.exists(ios_dir):
-            try:
-                subprocess.run(['which', 'pod'], check=True, capture_output=True)
-            except subprocess.CalledProcessError:
-                print("CocoaPods not found (skipping). Install with `brew install cocoapods`.")
-            else:
-                print("Installing iOS dependencies...")
-                res = subprocess.run(['pod', 'install'], cwd=ios_dir, env=env)
-                if res.returncode != 0:
-                    print("`pod install` failed. Common causes:")
-                    print(" - Missing @react-native-community/cli devDependencies")
-                    print(" - Ruby/CocoaPods setup issues")
-                    print("Try: `cd build && npm i -D @react-native-community/cli@^20 @react-native-community/cli-platform-ios@^20 @react-native-community/cli-platform-android@^20`")
-                    print("Then: `cd build/ios && pod install`")
-                else:
-                    print("✓ iOS dependencies installed")
+        ensure_ios_pods(ios_dir, env)
         return True
 
     finally:
@@ -384,10 +362,10 @@ def run_ios(port: int = 8000):
 
     # Single Node env to reuse everywhere
     env = ensure_node_env()
-    try:
-        node_ver = subprocess.run(["node", "-v"], capture_output=True, text=True, check=True, env=env).stdout.strip()
+    node_ver = node_version_output(env)
+    if node_ver:
         print(f"Using Node.js {node_ver} environment")
-    except Exception:
+    else:
         print("Using Node.js environment (version check failed)")
 
     native_name = to_rn_project_name(os.path.basename(PROJECT_ROOT))
@@ -455,12 +433,10 @@ def run_ios(port: int = 8000):
 
     print("Preparing iOS development...")
 
-    # Ensure native projects (and pods) are ready
+    # Ensure native projects (and pods) are ready; this also syncs the JS app name
     if not ensure_native_projects(custom_env=env, project_name=native_name):
         print("Failed to set up iOS project.")
         return
-    sync_js_app_name(BUILD_DIR, native_name)
-    ensure_ios_pods(ios_dir, env)
 
     # Simulators
     print("Checking for iOS simulators...")
@@ -557,11 +533,9 @@ def run_android():
         return
 
     print("Preparing Android development...")
-    try:
-        node_ver = subprocess.run(["node","-v"], capture_output=True, text=True, check=True, env=env).stdout.strip()
+    node_ver = node_version_output(env)
+    if node_ver:
         print(f"Using Node.js {node_ver} environment")
-    except Exception:
-        pass
 
     try:
         subprocess.run(["npm", "run", "android"], cwd=BUILD_DIR, check=True, env=env)
@@ -572,35 +546,49 @@ def run_android():
 # -----------------------------------------------------------------------------
 # Frontend helpers
 # -----------------------------------------------------------------------------
-def open_new_terminal_and_run_npm(build_dir: str, env: dict):
+def open_new_terminal_and_run_npm(build_dir: str, env: dict, npm_cmd: str = "npm start"):
+    """Open a new terminal window and run npm_cmd in build_dir,
+    ensuring the Node from `env` is used in that terminal session."""
     global spawned_processes
     system = platform.system()
+
+    # Derive the selected node bin dir from env (if any)
     node_path = shutil.which("node", path=env.get("PATH"))
     node_dir = os.path.dirname(node_path) if node_path else None
 
     try:
         if system == "Windows":
-            path_cmd = f'set "PATH={node_dir};%PATH%" && ' if node_dir else ''
-            inner = f'{path_cmd}cd /d "{build_dir}" && npm start'
-            cmd = f'start "" cmd /k "{inner}"'
-            p = subprocess.Popen(cmd, shell=True)
+            # A new console replaces `start`, so no extra shell is needed;
+            # env already carries the selected Node on PATH.
+            p = subprocess.Popen(['cmd', '/k', npm_cmd], cwd=build_dir, env=env,
+                                 creationflags=subprocess.CREATE_NEW_CONSOLE)
             spawned_processes.append(p)
+
         elif system == "Darwin":
+            # Prepend PATH if available
             prefix = f'export PATH="{node_dir}:$PATH"; ' if node_dir else ''
-            shell_cmd = f'{prefix}cd "{build_dir}" && npm start'
+            shell_cmd = f'{prefix}cd "{build_dir}" && {npm_cmd}'
+            # Escape double quotes for AppleScript string
             applescript_safe = shell_cmd.replace('"', r'\"')
-            p = subprocess.Popen(['osascript', '-e',
-                                  f'tell application "Terminal" to do script "{applescript_safe}"'])
+            p = subprocess.Popen(
+                ['osascript', '-e',
+                 f'tell application "Terminal" to do script "{applescript_safe}"']
+            )
             spawned_processes.append(p)
+
         else:
+            # Linux / *nix — try a few common terminals
             prefix = f'export PATH="{node_dir}:$PATH"; ' if node_dir else ''
-            bash_cmd = f'{prefix}cd "{build_dir}" && npm start; exec bash'
-            for cmd in (
+            bash_cmd = f'{prefix}cd "{build_dir}" && {npm_cmd}; exec bash'
+
+            candidates = [
                 ['gnome-terminal', '--', 'bash', '-lc', bash_cmd],
-                ['xterm', '-e', f'bash -lc \'{bash_cmd}\''],
-                ['konsole', '-e', f'bash -lc \'{bash_cmd}\''],
-                ['x-terminal-emulator', '-e', f'bash -lc \'{bash_cmd}\''],
-            ):
+                ['xterm', '-e', f'bash -lc \'{bash_cmd}\'' ],
+                ['konsole', '-e', f'bash -lc \'{bash_cmd}\'' ],
+                ['x-terminal-emulator', '-e', f'bash -lc \'{bash_cmd}\'' ],
+            ]
+
+            for cmd in candidates:
                 try:
                     p = subprocess.Popen(cmd)
                     spawned_processes.append(p)
@@ -608,9 +596,11 @@ def open_new_terminal_and_run_npm(build_dir: str, env: dict):
                 except FileNotFoundError:
                     continue
             else:
-                print("Could not find a suitable terminal emulator. Please run 'npm start' manually in the build directory.")
+                print("Could not find a suitable terminal emulator. "
+                      f"Please run '{npm_cmd}' manually in the build directory.")
+
     except Exception as e:
-        print(f"Failed to launch npm in a new terminal: {e}")
+        print(f"Failed to launch {npm_cmd} in a new terminal: {e}")
 
 
 # -----------------------------------------------------------------------------
@@ -706,63 +696,8 @@ def run_uvicorn_with_watch(port=8000):
 # Orchestration
 # -----------------------------------------------------------------------------
 def open_new_terminal_and_run_web(build_dir: str, env: dict):
-    """Open a new terminal window and run `npm run start:web` in build_dir,
-    ensuring the Node from `env` is used in that terminal session."""
-    global spawned_processes
-    system = platform.system()
-
-    # Derive the selected node bin dir from env (if any)
-    node_path = shutil.which("node", path=env.get("PATH"))
-    node_dir = os.path.dirname(node_path) if node_path else None
-
-    try:
-        if system == "Windows":
-            # Build PATH prefix only if we have a node_dir
-            path_cmd = f'set "PATH={node_dir};%PATH%" && ' if node_dir else ''
-            inner = f'{path_cmd}cd /d "{build_dir}" && npm run start:web'
-            # Use a single string with shell=True; start is a cmd builtin.
-            cmd = f'start "" cmd /k "{inner}"'
-            p = subprocess.Popen(cmd, shell=True)
-            spawned_processes.append(p)
-
-        elif system == "Darwin":
-            # Prepend PATH if available
-            prefix = f'export PATH="{node_dir}:$PATH"; ' if node_dir else ''
-            shell_cmd = f'{prefix}cd "{build_dir}" && npm run start:web'
-            # Escape double quotes for AppleScript string
-            applescript_safe = shell_cmd.replace('"', r'\"')
-            p = subprocess.Popen(
-                ['osascript', '-e',
-                 f'tell application "Terminal" to do script "{applescript_safe}"']
-            )
-            spawned_processes.append(p)
-
-        else:
-            # Linux / *nix — try a few common terminals
-            prefix = f'export PATH="{node_dir}:$PATH"; ' if node_dir else ''
-            bash_cmd = f'{prefix}cd "{build_dir}" && npm run start:web; exec bash'
-
-            candidates = [
-                ['gnome-terminal', '--', 'bash', '-lc', bash_cmd],
-                ['xterm', '-e', f'bash -lc \'{bash_cmd}\'' ],
-                ['konsole', '-e', f'bash -lc \'{bash_cmd}\'' ],
-                ['x-terminal-emulator', '-e', f'bash -lc \'{bash_cmd}\'' ],
-            ]
-
-            for cmd in candidates:
-                try:
-                    p = subprocess.Popen(cmd)
-                    spawned_processes.append(p)
-                    break
-                except FileNotFoundError:
-                    continue
-            else:
-                print("Could not find a suitable terminal emulator. "
-                      "Please run 'npm run start:web' manually in the build directory.")
-
-    except Exception as e:
-        print(f"Failed to launch web server in a new terminal: {e}")
-
+    """Open a new terminal window running `npm run start:web` with the Node from `env`."""
+    open_new_terminal_and_run_npm(build_dir, env, "npm run start:web")
 
 
 def run_command_logic(port=8000):
@@ -796,14 +731,7 @@ def run_command_logic(port=8000):
 # Project scaffolding
 # -----------------------------------------------------------------------------
 
-def write_netlify_toml(project_root: str):
-    netlify_path = os.path.join(project_root, "netlify.toml")
-    if os.path.exists(netlify_path):
-        # don’t overwrite if user already has one
-        print("netlify.toml already exists, leaving it untouched.")
-        return
-
-    content = """[build]
+NETLIFY_TOML = b"""[build]
 base = "build"
 command = "npm ci && npm run build:web"
 publish = "dist"
@@ -816,8 +744,21 @@ from = "/*"
 to = "/index.html"
 status = 200
 """
-    with open(netlify_path, "w", encoding="utf-8") as f:
-        f.write(content)
+
+# Package markers written into a new app; pre-encoded so they go straight to disk
+APP_INIT_PY = b"# OnRamp App Package\n"
+MODELS_INIT_PY = b"# Models package\n"
+DB_INIT_PY = b"# Database package\n"
+
+def write_netlify_toml(project_root: str):
+    netlify_path = os.path.join(project_root, "netlify.toml")
+    if os.path.exists(netlify_path):
+        # don’t overwrite if user already has one
+        print("netlify.toml already exists, leaving it untouched.")
+        return
+
+    with open(netlify_path, "wb") as f:
+        f.write(NETLIFY_TOML)
     print("✓ netlify.toml created")
 
 def create_app_directory(name, api_only=False):
@@ -840,8 +781,8 @@ def create_app_directory(name, api_only=False):
         write_netlify_toml(directory_path)
 
         # Make app a proper package
-        with open(os.path.join(backend_dir, '__init__.py'), 'w') as f:
-            f.write("# OnRamp App Package\n")
+        with open(os.path.join(backend_dir, '__init__.py'), 'wb') as f:
+            f.write(APP_INIT_PY)
 
         shutil.copyfile(importlib.resources.files(TEMPLATES_MODULE) / 'settings.py',
                         os.path.join(backend_dir, 'settings.py'))
@@ -850,13 +791,13 @@ def create_app_directory(name, api_only=False):
         os.makedirs(models_dir, exist_ok=True)
         shutil.copyfile(importlib.resources.files(TEMPLATES_MODULE) / 'models.py',
                         os.path.join(models_dir, 'models.py'))
-        with open(os.path.join(models_dir, '__init__.py'), 'w') as f:
-            f.write("# Models package\n")
+        with open(os.path.join(models_dir, '__init__.py'), 'wb') as f:
+            f.write(MODELS_INIT_PY)
 
         db_dir = os.path.join(backend_dir, 'db')
         os.makedirs(db_dir, exist_ok=True)
-        with open(os.path.join(db_dir, '__init__.py'), 'w') as f:
-            f.write("# Database package\n")
+        with open(os.path.join(db_dir, '__init__.py'), 'wb') as f:
+            f.write(DB_INIT_PY)
 
         if not api_only:
             routes_dir = os.path.join(backend_dir, 'routes')
@@ -987,6 +928,17 @@ def main():
         parser.add_argument("--port", type=int, default=8000, help="Port for the development server")
         parser.add_argument("--api", action="store_true", help="Create API-only app without React Native frontend")
         parser.add_argument("--web-only", action="store_true", help="Run web without backend")
+        parser.add_argument("--node-modules-tarball", metavar="PATH",
+                            help="Unpack a prebuilt node_modules archive instead of running npm install")
+        parser.add_argument("--package-manager", choices=("npm", "pnpm", "yarn"), default="npm",
+                            help="Package manager for the frontend install (default: npm)")
+        parser.add_argument("--node-modules-cache", metavar="DIR",
+                            help="Reuse installed node_modules trees from DIR, keyed by package.json")
+        parser.add_argument("--with", dest="features", action="append", default=[],
+                            choices=sorted(FEATURES), metavar="FEATURE",
+                            help=f"Add optional frontend tooling ({', '.join(sorted(FEATURES))}); repeatable")
+        parser.add_argument("--cache", action="store_true",
+                            help="Reuse the frontend files of an earlier run from the project cache")
         args = parser.parse_args()
 
         _clean_empty_shadow_dirs(PROJECT_ROOT)
@@ -999,7 +951,11 @@ def main():
                         os.chdir(original_cwd)
                     except Exception:
                         pass
-                    create_react_native_app(args.name)
+                    create_react_native_app(args.name, node_modules_tarball=args.node_modules_tarball,
+                                            package_manager=args.package_manager,
+                                            use_cache=args.cache,
+                                            node_modules_cache=args.node_modules_cache,
+                                            features=args.features)
             else:
                 print(f"Please provide a name for the new app. Usage: '{FRAMEWORK_NAME.lower()} new <name>'")
 
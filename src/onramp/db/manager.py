@@ -15,6 +15,7 @@ class DatabaseManager:
         self.app_dir = app_dir or self._find_app_directory()
         self.settings = self._load_settings()
         self.models = []
+        self._database_url = None
         
     def _find_app_directory(self):
         """Find the app directory"""
@@ -62,6 +63,12 @@ class DatabaseManager:
         return {'DATABASE': database_config}
     
     def _get_database_url(self):
+        """Database URL from settings, resolved once (settings are loaded once too)"""
+        if self._database_url is None:
+            self._database_url = self._build_database_url()
+        return self._database_url
+
+    def _build_database_url(self):
         """Generate database URL from settings"""
         db_config = self.settings['DATABASE']
         engine = db_config.get('engine', 'sqlite').lower()
@@ -6,30 +6,77 @@ Creates a React Native app with React Strict DOM and file-based navigation.
 Pinned to Node 20 ecosystem (RN CLI 20.x).
 '''
 
+import os
+import re
+import sys
 import subprocess
 import json
 import argparse
 import shutil
-import re
+import tarfile
+import hashlib
+import tempfile
+import filecmp
+import importlib.metadata
+import importlib.resources
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import os
-import re
-import subprocess
+
+_SEMVER_RE = re.compile(r"^v?(\d+)\.(\d+)\.(\d+)")
+_NODE_BIN_RE = re.compile(r"NODE_BIN:(.*)")
+_PKG_UNSAFE_RE = re.compile(r"[^a-z0-9._-]+")
+_PKG_DASHES_RE = re.compile(r"-{2,}")
+
+
+def semver_tuple(s: str):
+    m = _SEMVER_RE.match(s.strip())
+    return tuple(map(int, m.groups())) if m else (0, 0, 0)
+
+@lru_cache(maxsize=4)
+def _probe_node_version(node: str, mtime_ns: int) -> str:
+    # mtime_ns is only part of the cache key: a reinstalled node is probed again
+    try:
+        return subprocess.run([node, "-v"], text=True, capture_output=True, check=True).stdout.strip()
+    except Exception:
+        return ""
+
+def node_version_output(env=None) -> str:
+    """Raw `node -v` output, or "" if node is missing or fails.
+
+    Memoized per node binary, so repeated scaffolds in one process only
+    spawn node once.
+    """
+    node = shutil.which("node", path=(env or os.environ).get("PATH"))
+    if not node:
+        return ""
+    try:
+        mtime_ns = os.stat(node).st_mtime_ns
+    except OSError:
+        return ""
+    return _probe_node_version(node, mtime_ns)
+
+def current_node_version(env=None):
+    return semver_tuple(node_version_output(env))
+
+def _nvm_node_dir(nvm_dir: str, version: str):
+    """bin/ of an nvm-installed exact Node version, or None if it is not installed."""
+    bin_dir = os.path.join(nvm_dir, "versions", "node", f"v{version}", "bin")
+    return bin_dir if os.path.exists(os.path.join(bin_dir, "node")) else None
 
 def require_node(version_min="20.19.4"):
     """
     Ensure Node >= version_min. If not, offer to switch via nvm.
     On success, updates os.environ['PATH'] so child processes use the new Node.
+    Set ONRAMP_SKIP_NODE_CHECK to skip the check entirely (e.g. in CI).
     """
-    try:
-        out = subprocess.run(["node", "-v"], text=True, capture_output=True, check=True).stdout.strip()
-    except Exception:
-        out = ""
+    if os.environ.get("ONRAMP_SKIP_NODE_CHECK"):
+        return
 
-    m = re.match(r"v(\d+)\.(\d+)\.(\d+)", out or "")
-    cur = tuple(map(int, m.groups())) if m else (0, 0, 0)
-    want = tuple(map(int, version_min.split(".")))
+    out = node_version_output()
+    cur = semver_tuple(out)
+    want = semver_tuple(version_min)
 
     if cur and cur >= want:
         # already good
@@ -50,6 +97,25 @@ def require_node(version_min="20.19.4"):
         print(f"Then run: nvm install {version_min} && nvm use {version_min}")
         raise SystemExit(1)
 
+    node_dir = _nvm_node_dir(nvm_dir, version_min)
+    if node_dir:
+        # Already installed: no need to start a shell just to source nvm.sh
+        os.environ["PATH"] = f"{node_dir}:{os.environ.get('PATH','')}"  # prepend
+        _executable.cache_clear()
+    else:
+        _nvm_install_node(nvm_dir, version_min)
+
+    # Final sanity check
+    out2 = node_version_output()
+    if semver_tuple(out2) < want:
+        print(f"Unexpected: still on {out2}. Please switch manually.")
+        raise SystemExit(1)
+
+    print(f"✓ Node {out2} activated via nvm")
+
+
+def _nvm_install_node(nvm_dir: str, version_min: str) -> str:
+    """Install/use version_min through nvm and prepend its bin dir to PATH."""
     # Try to install/use exact target and capture node path
     script = f'''
       export NVM_DIR="{nvm_dir}"
@@ -59,46 +125,60 @@ def require_node(version_min="20.19.4"):
       echo NODE_BIN:$(command -v node)
       node -v
     '''
-    res = subprocess.run(["bash", "-lc", script], text=True, capture_output=True)
+    # nvm.sh is sourced explicitly, so a login shell (-l) is not needed
+    res = subprocess.run(["bash", "-c", script], text=True, capture_output=True)
     if res.returncode != 0:
         print("Failed to activate Node with nvm.\n", res.stdout or res.stderr)
         raise SystemExit(1)
 
     # Extract node bin and update PATH for this process (children inherit it)
-    mm = re.search(r"NODE_BIN:(.*)", res.stdout or "")
+    mm = _NODE_BIN_RE.search(res.stdout or "")
     if not mm:
         print("Could not resolve Node path from nvm output. Aborting.")
         raise SystemExit(1)
     node_bin = mm.group(1).strip()
     node_dir = os.path.dirname(node_bin)
     os.environ["PATH"] = f"{node_dir}:{os.environ.get('PATH','')}"  # prepend
+    _executable.cache_clear()
+    return node_dir
 
-    # Final sanity check
-    out2 = subprocess.run(["node", "-v"], text=True, capture_output=True, check=True).stdout.strip()
-    m2 = re.match(r"v(\d+)\.(\d+)\.(\d+)", out2 or "")
-    cur2 = tuple(map(int, m2.groups())) if m2 else (0, 0, 0)
-    if cur2 < want:
-        print(f"Unexpected: still on {out2}. Please switch manually.")
-        raise SystemExit(1)
 
-    print(f"✓ Node {out2} activated via nvm")
+# Environment additions for every command we run; npm otherwise checks the
+# registry for a newer npm on each invocation.
+COMMAND_ENV = {"NPM_CONFIG_UPDATE_NOTIFIER": "false"}
+
+
+@lru_cache(maxsize=None)
+def _executable(name: str) -> str:
+    '''Resolve a program on PATH once; also finds npm.cmd and friends on Windows.'''
+    return shutil.which(name) or name
 
 
-def run_command(command, cwd=None, check=True):
-    '''Run a shell command and return the result.'''
-    print(f"Running: {command}")
+def run_command(command, cwd=None, check=True, capture=True):
+    '''Run a command (an argv list, no shell) and return the result.
+
+    With capture, stdout is discarded and only stderr is piped so it can be
+    reported on failure. Pass capture=False for long-running commands such
+    as npm install to stream everything.
+    '''
+    print(f"Running: {' '.join(command)}")
+    if capture:
+        stdout, stderr = subprocess.DEVNULL, subprocess.PIPE
+    else:
+        stdout = stderr = None
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
+        return subprocess.run(
+            [_executable(command[0]), *command[1:]],
             cwd=cwd,
             check=check,
-            capture_output=True,
+            env={**os.environ, **COMMAND_ENV},
+            # Nothing we run needs input; a closed stdin keeps npm from probing
+            # or waiting on the terminal.
+            stdin=subprocess.DEVNULL,
+            stdout=stdout,
+            stderr=stderr,
             text=True,
         )
-        if result.stdout:
-            print(result.stdout)
-        return result
     except subprocess.CalledProcessError as e:
         print(f"Error running command: {e}")
         if e.stderr:
@@ -108,642 +188,302 @@ def run_command(command, cwd=None, check=True):
 def _npm_pkg_name(s: str) -> str:
     """Make a safe npm package name (lowercase, hyphenated)."""
     s = s.strip().lower()
-    s = re.sub(r'[^a-z0-9._-]+', '-', s)
-    s = re.sub(r'-{2,}', '-', s).strip('-')
+    s = _PKG_UNSAFE_RE.sub('-', s)
+    s = _PKG_DASHES_RE.sub('-', s).strip('-')
     return s or "app"
 
-def create_package_json(app_name: str, project_dir: Path):
-    """Create package.json with separate bundlers for web and native."""
-    pkg_name = _npm_pkg_name(app_name)
-
-    package = {
-        "name": pkg_name,
-        "version": "0.0.1",
-        "private": True,
-        "scripts": {
-            # Native
-            "android": "npx react-native run-android",
-            "ios": "npx react-native run-ios",
-            "start:native": "npx metro start --port 8081",
-            "start:rn": "npx react-native start",
-
-            # Web (webpack)
-            "start:web": "node scripts/build-routes.js && webpack serve",
-            "build:web": "node scripts/build-routes.js && webpack --mode production",
-
-            # Defaults
-            "start": "npm run start:native",
-            "web": "npm run start:web",
-            "build:routes": "node scripts/build-routes.js",
-            "test": "jest"
-        },
-        "dependencies": {
-            "@react-navigation/bottom-tabs": "^6.6.1",
-            "@react-navigation/native": "^6.1.18",
-            "@react-navigation/native-stack": "^6.9.26",
-            "@stylexjs/stylex": "^0.8.0",
-            "react": "19.1.0",
-            "react-dom": "19.1.0",
-            "react-native": "0.81.1",
-            "react-native-gesture-handler": "^2.16.2",
-            "react-native-safe-area-context": "^5.6.1",
-            "react-native-screens": "^4.6.0",
-            "react-strict-dom": "^0.0.44",
-        },
-        "devDependencies": {
-            "@babel/core": "^7.24.0",
-            "@babel/preset-env": "^7.24.0",
-            "@babel/preset-react": "^7.24.0",
-            "@babel/preset-typescript": "^7.24.0",
-            "@babel/runtime": "^7.24.0",
-
-            "@react-native/babel-preset": "0.81.1",
-            "@react-native/metro-config": "0.81.1",
-
-            "@stylexjs/babel-plugin": "^0.8.0",
-
-            "@react-native-community/cli": "^20.0.2",
-            "@react-native-community/cli-platform-ios": "^20.0.2",
-            "@react-native-community/cli-platform-android": "^20.0.2",
-
-            # Web bundling
-            "webpack": "^5.88.0",
-            "webpack-cli": "^5.1.0",
-            "webpack-dev-server": "^4.15.0",
-            "babel-loader": "^9.1.0",
-            "html-webpack-plugin": "^5.5.0",
-
-            # Types
-            "@types/react": "^19.1.0",
-            "@types/react-dom": "^19.1.0",
-            "typescript": "^5.6.2",
-
-            # Tooling
-            "prettier": "^2.8.8",
-            "chokidar": "^3.5.3",
-
-            # Tests (optional but nice to pin)
-            "jest": "^29.7.0",
-            "react-test-renderer": "19.1.0"
-        },
-        "jest": { "preset": "react-native" },
-        "engines": { "node": ">=20.19.4" },
-        "packageManager": "npm@10"
-    }
-
-    (project_dir / "package.json").write_text(
-        json.dumps(package, indent=2) + "\n",
-        encoding="utf-8"
-    )
-
-def create_webpack_config(project_dir: Path):
-    webpack_config = '''const path = require('path');
-const HtmlWebpackPlugin = require('html-webpack-plugin');
-
-module.exports = {
-  entry: './index.web.js',
-  mode: 'development',
-  devServer: {
-    port: 'auto',
-    historyApiFallback: true,
-    static: { directory: path.join(__dirname, 'assets') },
-  },
-  module: {
-    rules: [
-      // App code
-      {
-        test: /\\.(js|jsx|ts|tsx)$/,
-        exclude: /node_modules/,
-        use: {
-          loader: 'babel-loader',
-          options: {
-            // Use only these options for web (avoid metro config bleed-through)
-            babelrc: false,
-            configFile: false,
-            presets: [
-              ['@babel/preset-env', { targets: 'defaults' }],
-              ['@babel/preset-react', { runtime: 'automatic' }],
-              ['@babel/preset-typescript'],
-              ['react-strict-dom/babel-preset', { platform: 'web' }]
-            ],
-            plugins: [
-              ['@stylexjs/babel-plugin', {
-                dev: true,
-                runtimeInjection: false,
-                genConditionalClasses: true,
-                treeshakeCompensation: true,
-                unstable_moduleResolution: { type: 'commonJS', rootDir: __dirname }
-              }]
-            ]
-          }
-        }
-      },
-      // Transpile react-strict-dom itself for web
-      {
-        test: /\\.(js|jsx|ts|tsx)$/,
-        include: /node_modules[\\/]react-strict-dom/,
-        use: {
-          loader: 'babel-loader',
-          options: {
-            babelrc: false,
-            configFile: false,
-            presets: [
-              ['@babel/preset-env', { targets: 'defaults' }],
-              ['@babel/preset-react', { runtime: 'automatic' }],
-              ['react-strict-dom/babel-preset', { platform: 'web' }]
-            ],
-            plugins: [
-              ['@stylexjs/babel-plugin', {
-                dev: true,
-                runtimeInjection: false,
-                genConditionalClasses: true,
-                treeshakeCompensation: true,
-                unstable_moduleResolution: { type: 'commonJS', rootDir: __dirname }
-              }]
-            ]
-          }
-        }
-      }
-    ]
-  },
-  resolve: {
-    extensions: ['.web.js','.web.jsx','.web.ts','.web.tsx','.js','.jsx','.ts','.tsx'],
-    alias: { 'react-native$': 'react-strict-dom' }
-  },
-  plugins: [ new HtmlWebpackPlugin({ template: 'index.html', inject: true }) ],
-  output: { path: path.resolve(__dirname, 'dist'), filename: 'bundle.js', publicPath: '/' }
-};'''
-    (project_dir / "webpack.config.js").write_text(webpack_config)
-
-def create_web_index_html(project_dir: Path):
-    '''Create HTML template for Webpack.'''
-    html_content = '''<!DOCTYPE html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>OnRamp App</title>
-  <style>
-  html, body, #root { height: 100%; margin: 0; }
-  #root { display: flex; flex-direction: column; }
-</style>
-</head>
-<body>
-  <div id="root"></div>
-</body>
-</html>
-'''
-    (project_dir / "index.html").write_text(html_content)
-
+# package.json with separate bundlers for web and native. Everything but the
+# name is static, so each variant is serialized once (see _package_json_template).
+# Versions are exact pins, the ones the scaffold is tested against: installs
+# are reproducible and nothing is left for npm to resolve against the registry.
+PACKAGE_JSON = {
+    "name": "{{APP}}",
+    "version": "0.0.1",
+    "private": True,
+    # App modules are side-effect free apart from stylesheets, so webpack may
+    # drop unused re-exports
+    "sideEffects": ["*.css"],
+    "scripts": {
+        # Native
+        "android": "npx react-native run-android",
+        "ios": "npx react-native run-ios",
+        "start:native": "npx metro start --port 8081",
+        "start:rn": "npx react-native start",
+
+        # Web (webpack)
+        "start:web": "node scripts/build-routes.js && webpack serve",
+        "build:web": "node scripts/build-routes.js && webpack --mode production",
+
+        # Defaults
+        "start": "npm run start:native",
+        "web": "npm run start:web",
+        "build:routes": "node scripts/build-routes.js"
+    },
+    "dependencies": {
+        "@react-navigation/bottom-tabs": "6.6.1",
+        "@react-navigation/native": "6.1.18",
+        "@react-navigation/native-stack": "6.9.26",
+        "@stylexjs/stylex": "0.8.0",
+        "react": "19.1.0",
+        "react-dom": "19.1.0",
+        "react-native": "0.81.1",
+        "react-native-gesture-handler": "2.16.2",
+        "react-native-safe-area-context": "5.6.1",
+        "react-native-screens": "4.6.0",
+        "react-strict-dom": "0.0.44",
+    },
+    "devDependencies": {
+        "@babel/core": "7.24.0",
+        "@babel/preset-env": "7.24.0",
+        "@babel/preset-react": "7.24.0",
+        "@babel/preset-typescript": "7.24.0",
+        "@babel/runtime": "7.24.0",
+
+        "@react-native/babel-preset": "0.81.1",
+        "@react-native/metro-config": "0.81.1",
+
+        "@stylexjs/babel-plugin": "0.8.0",
+
+        "@react-native-community/cli": "20.0.2",
+        "@react-native-community/cli-platform-ios": "20.0.2",
+        "@react-native-community/cli-platform-android": "20.0.2",
+
+        # Web bundling
+        "webpack": "5.88.0",
+        "webpack-cli": "5.1.0",
+        "webpack-dev-server": "4.15.0",
+        "babel-loader": "9.1.0",
+        "thread-loader": "4.0.2",
+        "css-loader": "6.8.0",
+        "mini-css-extract-plugin": "2.7.0",
+        "html-webpack-plugin": "5.5.0",
+
+        # Types
+        "@types/react": "19.1.0",
+        "@types/react-dom": "19.1.0",
+        "typescript": "5.6.2",
+
+        # Route watcher (scripts/build-routes.js)
+        "chokidar": "3.5.3"
+    },
+    "engines": { "node": ">=20.19.4" },
+    "packageManager": "npm@10"
+}
 
-def create_web_entry(project_dir: Path):
-    '''Create web entry point for Webpack (React Strict DOM target).'''
-    web_entry = '''import React from 'react';
-import { createRoot } from 'react-dom/client';
-import App from './App';
 
-const container = document.getElementById('root');
-if (container) {
-  const root = createRoot(container);
-  root.render(<App />);
+# Opt-in extras (`onramp new --with tests`), merged into PACKAGE_JSON. Nothing
+# in the scaffold needs them, and each one pulls a sizeable dependency tree.
+FEATURES = {
+    "tests": {
+        "scripts": {"test": "jest"},
+        "devDependencies": {"jest": "29.7.0", "react-test-renderer": "19.1.0"},
+        "jest": {"preset": "react-native"},
+    },
+    "prettier": {
+        "scripts": {"format": "prettier --write ."},
+        "devDependencies": {"prettier": "2.8.8"},
+    },
 }
-'''
-    (project_dir / "index.web.js").write_text(web_entry)
 
 
-def copy_navigation_templates(project_dir: Path):
-    script_dir    = Path(__file__).parent
-    templates_dir = script_dir / "templates"
+@lru_cache(maxsize=None)
+def _package_json_template(pinned_npm: bool, features: frozenset = frozenset()) -> bytes:
+    package = dict(PACKAGE_JSON)
+    if not pinned_npm:
+        # pnpm/yarn refuse to install into a project pinned to npm
+        del package["packageManager"]
+    for feature in sorted(features):
+        for key, value in FEATURES[feature].items():
+            package[key] = {**package[key], **value} if key in package else value
+    return (json.dumps(package, indent=2) + "\n").encode("utf-8")
 
-    src_dir        = project_dir / "src"
-    navigation_dir = src_dir / "navigation"
-    generated_dir  = src_dir / "generated"
-    scripts_dir    = project_dir / "scripts"
-    build_dir      = project_dir            # <-- use the existing build root
 
-    for p in (src_dir, navigation_dir, generated_dir, scripts_dir, build_dir):
-        p.mkdir(parents=True, exist_ok=True)
+def render_package_json(app_name: str, package_manager: str = "npm",
+                        features: frozenset = frozenset()) -> bytes:
+    """Render package.json for app_name; the npm-safe name needs no JSON escaping."""
+    template = _package_json_template(package_manager == "npm", frozenset(features))
+    return template.replace(b"{{APP}}", _npm_pkg_name(app_name).encode("ascii"))
 
-    if not templates_dir.exists():
-        print("⚠️  Templates folder not found — creating basic navigation structure")
-        create_basic_navigation_structure(project_dir)
-        # also ensure generateRoutes.js exists as a stub
-        (build_dir / "generateRoutes.js").write_text(
-            "module.exports = function generateRoutes(){ /* noop */ };\n"
-        )
-        return
 
-    template_map = {
-        "generateRoutes.js":      build_dir / "generateRoutes.js",
-        "NavigationProvider.tsx": navigation_dir / "NavigationProvider.tsx",
-        "RouteRegistry.tsx":      navigation_dir / "RouteRegistry.tsx",
-        "build-routes.js":        scripts_dir / "build-routes.js",
-    }
+# Install command per supported package manager. pnpm and yarn reuse a
+# global content-addressed store, which makes repeat scaffolds much cheaper.
+# Reuse the local cache where possible and skip the audit and funding lookups,
+# which are extra network round-trips unrelated to resolving the tree.
+NPM_INSTALL_FLAGS = ["--legacy-peer-deps", "--prefer-offline", "--no-audit", "--no-fund"]
 
-    for template_name, dest_path in template_map.items():
-        src_path = templates_dir / template_name
-        if src_path.exists():
-            print(f"Copying {template_name} to {dest_path}")
-            shutil.copy2(src_path, dest_path)
-        else:
-            print(f"⚠️  Template {template_name} not found — creating a basic version")
-            create_basic_template(template_name, dest_path)
-
-
-
-def create_basic_navigation_structure(project_dir: Path):
-    '''Create basic navigation structure if templates aren't available.'''
-    src_dir = project_dir / "src"
-    navigation_dir = src_dir / "navigation"
-    generated_dir = src_dir / "generated"
-    scripts_dir = project_dir / "scripts"
-
-    for d in [src_dir, navigation_dir, generated_dir, scripts_dir]:
-        d.mkdir(parents=True, exist_ok=True)
-
-    basic_script = (
-        '#!/usr/bin/env node\n'
-        'console.log("File-based routing: Scanning for routes...");\n\n'
-        'const fs = require("fs");\n'
-        'const path = require("path");\n\n'
-        'function generateRoutes() {\n'
-        '  const routes = [];\n'
-        '  const appDir = path.join(__dirname, "..", "app");\n'
-        '  if (!fs.existsSync(appDir)) { fs.mkdirSync(appDir, { recursive: true }); }\n'
-        '  console.log("Routes generated successfully");\n'
-        '}\n'
-        'generateRoutes();\n'
-    )
-    (scripts_dir / "build-routes.js").write_text(basic_script)
-
-
-def create_basic_template(template_name: str, dest_path: Path):
-    '''Create basic versions of templates if not found.'''
-    if template_name == "NavigationProvider.tsx":
-        content = '''// Basic Navigation Provider
-import React, { createContext, useContext, useRef } from 'react';
-
-const NavigationContext = createContext({
-  currentRoute: '/',
-  params: {},
-  navigate: (_path) => {},
-  goBack: () => {},
-  canGoBack: () => false
-});
-
-export function NavigationProvider({ children, initialRoute = '/' }) {
-  const history = useRef([initialRoute]);
-  const paramsRef = useRef({});
-
-  const api = {
-    get currentRoute() { return history.current[history.current.length - 1]; },
-    get params() { return paramsRef.current; },
-    navigate: (path, params = {}) => { history.current.push(path); paramsRef.current = params; },
-    goBack: () => { if (history.current.length > 1) history.current.pop(); },
-    canGoBack: () => history.current.length > 1,
-  };
-
-  return <NavigationContext.Provider value={api}>{children}</NavigationContext.Provider>;
+INSTALL_COMMANDS = {
+    "npm":  ["npm", "install", *NPM_INSTALL_FLAGS],
+    "pnpm": ["pnpm", "install", "--prefer-offline"],
+    "yarn": ["yarn", "install"],
 }
 
-export function useNavigation() { return useContext(NavigationContext); }
-'''
-        dest_path.write_text(content)
-    elif template_name == "RouteRegistry.tsx":
-        content = '''// Minimal Route Registry glue (replace with your generator output)
-import React from 'react';
-import HomePage from '../../app/index';
-import AboutPage from '../../app/about';
-
-export function RouteComponent({ path, params }) {
-  if (path === '/about') return <AboutPage />;
-  if (path.startsWith('/profile/')) {
-    const id = path.split('/').pop();
-    const Profile = require('../../app/profile/[id]').default;
-    return <Profile id={id} />;
-  }
-  return <HomePage />;
-}
-'''
-        dest_path.write_text(content)
-    elif template_name == "generateRoutes.js":
-        dest_path.write_text(
-            "module.exports = function generateRoutes(){ /* noop */ };\n"
-        )
-    elif template_name == "build-routes.js":
-        dest_path.write_text(
-            '#!/usr/bin/env node\n'
-            'console.log("File-based routing: Scanning for routes...");\n'
-            'try { require("../generateRoutes")(); } catch (e) { /* optional */ }\n'
-            'console.log("Routes generated successfully");\n'
-        )
-    else:
-        dest_path.write_text('// Template placeholder\n')
-
-
-def create_app_structure(project_dir: Path):
-    '''Create the app directory structure for file-based routing.'''
-    app_dir = project_dir / "app"
-    app_dir.mkdir(exist_ok=True)
-
-    index_content = '''import React from 'react';
-import { html } from 'react-strict-dom';
-import { useNavigation } from '../src/navigation/NavigationProvider';
-
-export default function HomePage() {
-  const { navigate } = useNavigation();
-
-  function Greeting() {
-    return(
-
-      <html.div style={{ 
-        color: '#333', 
-        marginBottom: 16, 
-        fontWeight: 'bold',  
-        } as any}>
-        
-        <html.h1
-          style={{ fontSize: 36, } as any}
-        >Hello</html.h1>
-        <html.h2
-          style={{ fontSize: 30, } as any}
-        >I'm OnRamp</html.h2>
-        <html.h2
-          style={{ fontSize: 30, } as any}
-        >
-          The Python App Framework
-        </html.h2>
-
-      </html.div>
-    )
-  }
-
-  function Grid() {
-    return(
-      <html.div
-        style={{
-          backgroundColor: 'white',
-          padding: 30,
-          borderRadius: 12,
-          boxShadow: '0 2px 8px rgba(0,0,0,0.1)',
-          maxWidth: 500,
-          alignSelf: 'center',   // center horizontally without width:'100%'
-          // If you prefer the card to stretch on small screens, use:
-          // alignSelf: 'stretch',
-        } as any}
-      >
-        <html.h1
-          style={{ fontSize: 24, color: '#333', marginBottom: 16, fontWeight: 'bold', textAlign: 'center' } as any}
-        >
-          Welcome to OnRamp
-        </html.h1>
-        <html.h2
-          style={{ fontSize: 19, color: '#333', marginBottom: 16, fontWeight: 'bold', textAlign: 'center' } as any}
-        >
-          The Python App Framework
-        </html.h2>
-        <html.div style={{ display: 'flex', gap: 10, justifyContent: 'center', flexDirection: 'column' } as any}>
-          <html.button
-            onClick={() => navigate('/profile/123')}
-            style={{ padding: '10px 20px', backgroundColor: '#007AFF', color: 'white', border: 'none', borderRadius: 6, cursor: 'pointer' } as any}
-          >
-            Go to Profile
-          </html.button>
-          <html.button
-            onClick={() => navigate('/about')}
-            style={{ padding: '10px 20px', backgroundColor: '#34C759', color: 'white', border: 'none', borderRadius: 6, cursor: 'pointer' } as any}
-          >
-            About Page
-          </html.button>
-        </html.div>
-      </html.div>
-    )
-  }
-
-  function Footer() {
-    return(
-      <></>
-    )
-  }
-
-  return (
-    <html.div
-      style={{
-        flex: 1,
-        display: 'flex',
-        justifyContent: 'center',
-        alignItems: 'center',
-        padding: 20,
-        //margin: 100,
-        fontFamily: 'system-ui, -apple-system, sans-serif',
-        backgroundColor: '#f5f5f5',
-      } as any}
-    >
-      <Greeting />
-      <Grid />
-      <Footer />
-    </html.div>
-  );
+# Metro can't follow pnpm's symlinked layout or Yarn PnP, so both are told
+# to lay out a flat node_modules like npm does.
+PACKAGE_MANAGER_CONFIG = {
+    "pnpm": (".npmrc", b"node-linker=hoisted\n"),
+    "yarn": (".yarnrc.yml", b"nodeLinker: node-modules\n"),
 }
 
-'''
-    (app_dir / "index.tsx").write_text(index_content)
-
-    profile_dir = app_dir / "profile"
-    profile_dir.mkdir(exist_ok=True)
-
-    profile_content = '''import React from 'react';
-import { html } from 'react-strict-dom';
-import { useNavigation } from '../../src/navigation/NavigationProvider';
-
-export default function ProfilePage({ id }) {
-  const { navigate, goBack, canGoBack } = useNavigation();
-
-  return (
-    <html.div style={{
-      padding: 20,
-      fontFamily: 'system-ui, -apple-system, sans-serif',
-      flex: 1,
-      backgroundColor: '#f5f5f5'
-    }as any}>
-      <html.div style={{
-        backgroundColor: 'white',
-        padding: 30,
-        borderRadius: 12,
-        boxShadow: '0 2px 8px rgba(0,0,0,0.1)',
-        maxWidth: 600
-      }as any}>
-        <html.h1 style={{ color: '#333', marginBottom: 16 }}>Profile Page</html.h1>
-        <html.p style={{ color: '#666', marginBottom: 20 }}>Profile ID: {id || 'No ID provided'}</html.p>
-        <html.div style={{ display: 'flex', gap: 10 }}>
-          {canGoBack() && (
-            <html.button 
-              onClick={goBack}
-              style={{ padding: '10px 20px', backgroundColor: '#666', color: 'white', border: 'none', borderRadius: 6, cursor: 'pointer' }as any}
-            >Go Back</html.button>
-          )}
-          <html.button 
-            onClick={() => navigate('/')}
-            style={{ padding: '10px 20px', backgroundColor: '#007AFF', color: 'white', border: 'none', borderRadius: 6, cursor: 'pointer' }as any}
-          >Home</html.button>
-        </html.div>
-      </html.div>
-    </html.div>
-  );
-}
-'''
-    (profile_dir / "[id].tsx").write_text(profile_content)
-
-    about_content = '''import React from 'react';
-import { html } from 'react-strict-dom';
-import { useNavigation } from '../src/navigation/NavigationProvider';
-
-export default function AboutPage() {
-  const { navigate, goBack } = useNavigation();
-
-  return (
-    <html.div style={{
-      padding: 20,
-      fontFamily: 'system-ui, -apple-system, sans-serif',
-      flex: 1,
-      backgroundColor: '#f5f5f5'
-    }as any}>
-      <html.div style={{
-        backgroundColor: 'white',
-        padding: 30,
-        borderRadius: 12,
-        boxShadow: '0 2px 8px rgba(0,0,0,0.1)',
-        maxWidth: 600
-      }as any}>
-        <html.h1 style={{ color: '#333', marginBottom: 16 }as any}>About OnRamp</html.h1>
-        <html.p style={{ color: '#666', marginBottom: 20 }as any}>
-          OnRamp is a modern framework for building cross-platform applications with React Native and React Strict DOM.
-        </html.p>
-        <html.div style={{ display: 'flex', gap: 10 }as any}>
-          <html.button 
-            onClick={goBack}
-            style={{ padding: '10px 20px', backgroundColor: '#666', color: 'white', border: 'none', borderRadius: 6, cursor: 'pointer' }as any}
-          >Go Back</html.button>
-          <html.button 
-            onClick={() => navigate('/')}
-            style={{ padding: '10px 20px', backgroundColor: '#007AFF', color: 'white', border: 'none', borderRadius: 6, cursor: 'pointer' }as any}
-          >Home</html.button>
-        </html.div>
-      </html.div>
-    </html.div>
-  );
-}
-'''
-    (app_dir / "about.tsx").write_text(about_content)
+# Written after a successful install. It lives inside node_modules so that
+# deleting node_modules also drops the stamp.
+INSTALL_STAMP = "node_modules/.onramp-install-hash"
 
 
-def create_app_component(project_dir: Path):
-    '''Create the main App component that uses the navigation system.'''
-    app_component = '''import React from 'react';
-import { NavigationProvider, useNavigation } from './src/navigation/NavigationProvider';
-import { RouteComponent } from './src/navigation/RouteRegistry';
+# The package.json fields that decide what ends up in node_modules. The name
+# and scripts don't, so projects that differ only in those share a hash.
+INSTALL_FIELDS = ("dependencies", "devDependencies", "overrides", "resolutions", "engines")
 
-function AppContent() {
-  const { currentRoute, params } = useNavigation();
-  return <RouteComponent path={currentRoute} params={params} />;
-}
+# The lockfile each package manager keeps next to package.json
+LOCKFILES = {"npm": "package-lock.json", "pnpm": "pnpm-lock.yaml", "yarn": "yarn.lock"}
 
-export default function App() {
-  return (
-    <NavigationProvider initialRoute="/">
-      <AppContent />
-    </NavigationProvider>
-  );
-}
-'''
-    (project_dir / "App.jsx").write_text(app_component)
-
-
-def create_typescript_config(project_dir: Path):
-    '''Create TypeScript configuration.'''
-    tsconfig = {
-        "compilerOptions": {
-            "target": "ES2020",
-            "lib": ["ES2020", "DOM"],
-            "allowJs": True,
-            "skipLibCheck": True,
-            "esModuleInterop": True,
-            "allowSyntheticDefaultImports": True,
-            "strict": True,
-            "forceConsistentCasingInFileNames": True,
-            "moduleResolution": "bundler",
-            "resolveJsonModule": True,
-            "isolatedModules": True,
-            "noEmit": True,
-            "jsx": "react-jsx"
-        },
-        "include": ["src/**/*", "app/**/*", "App.jsx"],
-        "exclude": ["node_modules"]
-    }
-    (project_dir / "tsconfig.json").write_text(json.dumps(tsconfig, indent=2))
 
+def _install_hash(project_dir: Path, package_manager: str) -> str:
+    '''Hash what decides the installed tree: the package manager, the
+    dependency fields of package.json and the lockfile, if there is one.'''
+    data = json.loads((project_dir / "package.json").read_bytes())
+    relevant = {k: data.get(k) for k in INSTALL_FIELDS}
+    h = hashlib.sha256(package_manager.encode("utf-8") + b"\0")
+    h.update(json.dumps(relevant, sort_keys=True).encode("utf-8"))
+    try:
+        h.update(b"\0" + (project_dir / LOCKFILES[package_manager]).read_bytes())
+    except FileNotFoundError:
+        pass
+    return h.hexdigest()
 
-def create_babel_config(project_dir: Path):
-    babel_config = '''module.exports = {
-  // Metro (native) only
-  presets: ['module:@react-native/babel-preset'],
-  plugins: ['@stylexjs/babel-plugin'],
-};'''
-    (project_dir / "babel.config.js").write_text(babel_config)
 
+def _install_is_current(project_dir: Path, install_hash: str) -> bool:
+    try:
+        return (project_dir / INSTALL_STAMP).read_text() == install_hash
+    except OSError:
+        return False
 
 
-def create_metro_config(project_dir: Path):
-    '''Create Metro configuration for native builds only.'''
-    metro_config = '''const {getDefaultConfig, mergeConfig} = require('@react-native/metro-config');
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
-const defaultConfig = getDefaultConfig(__dirname);
 
-const config = {
-  resolver: { platforms: ['ios', 'android', 'native'] },
-};
+def _link_tree(src: Path, dst: Path):
+    # Hardlinks cost no file data, but they share it: a package patched in
+    # place inside one project changes the cached copy too.
+    shutil.copytree(src, dst, symlinks=True, copy_function=_link_or_copy, dirs_exist_ok=True)
 
-module.exports = mergeConfig(defaultConfig, config);
-'''
-    (project_dir / "metro.config.js").write_text(metro_config)
 
+def link_cached_node_modules(cache_dir, install_hash: str, project_dir: Path) -> bool:
+    '''Populate node_modules from cache_dir/<install_hash>/ if that entry exists.'''
+    cached = Path(cache_dir) / install_hash / "node_modules"
+    if not cached.is_dir():
+        return False
+    print(f"Linking node_modules from {cached}")
+    try:
+        _link_tree(cached, project_dir / "node_modules")
+    except (shutil.Error, OSError) as e:
+        print(f"⚠️  Could not use cached node_modules: {e}")
+        return False
+    return True
 
-def create_index_files(project_dir: Path, app_name: str):
-    '''Create index files for React Native.'''
-    rn_index = f'''import {{ AppRegistry }} from 'react-native';
-import App from './App';
-import {{ name as appName }} from './app.json';
 
-AppRegistry.registerComponent(appName, () => App);
-'''
-    (project_dir / "index.js").write_text(rn_index)
+def store_node_modules(cache_dir, install_hash: str, project_dir: Path):
+    cache_dir = Path(cache_dir)
+    entry = cache_dir / install_hash
+    if (entry / "node_modules").is_dir():
+        return
+    tmp = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # Build next to the final entry, then rename it into place in one step
+        tmp = Path(tempfile.mkdtemp(dir=cache_dir))
+        _link_tree(project_dir / "node_modules", tmp / "node_modules")
+        os.rename(tmp, entry)
+    except (shutil.Error, OSError) as e:
+        print(f"Warning: could not cache node_modules: {e}")
+        if tmp:
+            shutil.rmtree(tmp, ignore_errors=True)
+
+
+def _write_install_stamp(project_dir: Path, install_hash: str):
+    try:
+        (project_dir / INSTALL_STAMP).write_text(install_hash)
+    except OSError:
+        pass  # only costs the next run a redundant install
+
+
+# Every directory the generator writes into outside the scaffold tree, listed
+# parents first so each one is a single mkdir (see make_project_dirs).
+PROJECT_DIRS = ("src", "src/generated", "assets")
+
+
+def make_project_dirs(project_dir: Path):
+    '''Create project_dir and PROJECT_DIRS with one mkdir per directory.'''
+    os.makedirs(project_dir, exist_ok=True)
+    root = os.fspath(project_dir)
+    for d in PROJECT_DIRS:
+        try:
+            os.mkdir(os.path.join(root, d))
+        except FileExistsError:
+            pass
 
 
-def create_app_json(project_dir: Path, app_name: str):
-    '''Create app.json for React Native.'''
-    app_json = { "name": app_name, "displayName": app_name }
-    (project_dir / "app.json").write_text(json.dumps(app_json, indent=2))
+def copy_scaffold(project_dir: Path):
+    '''Copy the static scaffold tree (bundler configs, entry points, starter
+    pages, navigation runtime and the route generator scripts).
+
+    The files live under templates/rn/ mirroring the project layout, so the
+    whole tree is materialized with one copytree instead of a writer per file.
+    Files go through shutil.copyfile (sendfile on Linux) rather than copy2;
+    the package's mtimes and permission bits are of no use to the project.
+    Files that are already identical are left alone (see _copy_if_changed).
+    '''
+    scaffold = importlib.resources.files("onramp.templates") / "rn"
+    if not scaffold.is_dir():
+        # Package data is part of the install; without it there is nothing
+        # sensible to generate, so don't fall back to stub files.
+        raise FileNotFoundError(f"Scaffold templates missing from the onramp package: {scaffold}")
+    with importlib.resources.as_file(scaffold) as scaffold_dir:
+        shutil.copytree(scaffold_dir, project_dir, dirs_exist_ok=True,
+                        copy_function=_copy_if_changed)
+
+
+def _copy_if_changed(src, dst):
+    '''copytree copy_function that keeps identical files untouched.
+
+    Re-running the generator over an existing project then preserves their
+    mtimes, so webpack's and Metro's caches stay valid.
+    '''
+    try:
+        if filecmp.cmp(src, dst, shallow=False):
+            return dst
+    except OSError:
+        pass  # dst doesn't exist yet
+    return shutil.copyfile(src, dst)
 
 
 def copy_static_assets(project_dir: Path):
     '''Copy static assets like logo.png to the project.'''
-    script_dir = Path(__file__).parent
-    static_dir = script_dir / "static"
-
-    if static_dir.exists():
-        print("Copying static assets")
-        logo_source = static_dir / "logo.png"
-        if logo_source.exists():
-            (project_dir / "assets").mkdir(exist_ok=True)
-            shutil.copy2(logo_source, project_dir / "logo.png")
-            shutil.copy2(logo_source, project_dir / "assets" / "logo.png")
-    else:
-        print("⚠️  Static folder not found - skipping asset copy")
+    # Loaded through importlib.resources like the scaffold, so it also works
+    # when onramp is installed as a zip; read once, written to both places.
+    logo = importlib.resources.files("onramp.static") / "logo.png"
+    if not logo.is_file():
+        print("⚠️  Static assets not found - skipping asset copy")
+        return
+    print("Copying static assets")
+    data = logo.read_bytes()
+    root = os.fspath(project_dir)
+    _write_bytes(os.path.join(root, "logo.png"), data)
+    _write_bytes(os.path.join(root, "assets", "logo.png"), data)
 
 
-def create_readme(project_dir: Path, app_name: str):
-    '''Create README with instructions (no triple-backticks to avoid chat render issues).'''
-    readme_content = f'''# {app_name}
+# Scaffold files that mention the app name, with "{{APP}}" placeholders.
+# Anything without the app name lives in templates/rn.
+APP_JSON = b'''{
+  "name": "{{APP}}",
+  "displayName": "{{APP}}"
+}'''
+
+# README without triple-backticks to avoid chat render issues.
+README = b'''# {{APP}}
 
 React Native app with React Strict DOM and file-based navigation.
 
@@ -774,42 +514,225 @@ React Native app with React Strict DOM and file-based navigation.
 ### iOS (macOS only)
 - Xcode + iOS Simulator + CocoaPods
 '''
-    (project_dir / "README.md").write_text(readme_content)
 
 
-def create_react_native_app(app_name: str, output_dir: str = "."):
-    """Create a React Native app with separate web and native bundling."""
+# Kept out of templates/rn because dotfiles are easy to lose from package data.
+# The webpack and babel-loader caches live under node_modules/.cache.
+GITIGNORE = b'''node_modules/
+dist/
+ios/Pods/
+ios/build/
+android/.gradle/
+android/app/build/
+'''
 
-    require_node()
 
-    project_dir = Path(output_dir) / app_name / "build"
-    project_dir.mkdir(parents=True, exist_ok=True)
+def render_project_files(app_name: str, package_manager: str,
+                         features: frozenset = frozenset()) -> dict:
+    '''Return {relative path: bytes} for every generated (non-template) file.'''
+    files = {
+        # Inside a JSON string, so escaped the way json.dumps escapes it
+        "app.json": APP_JSON.replace(b"{{APP}}", json.dumps(app_name)[1:-1].encode("utf-8")),
+        "README.md": README.replace(b"{{APP}}", app_name.encode("utf-8")),
+    }
+    files["package.json"] = render_package_json(app_name, package_manager, features)
+    files[".gitignore"] = GITIGNORE
+    config = PACKAGE_MANAGER_CONFIG.get(package_manager)
+    if config:
+        files[config[0]] = config[1]
+    return files
+
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _same_contents(path: str, data: bytes) -> bool:
+    try:
+        if os.stat(path).st_size != len(data):
+            return False
+        with open(path, "rb") as f:
+            return f.read() == data
+    except OSError:
+        return False
+
+
+def _write_bytes(path: str, data: bytes):
+    '''Write data with raw os calls, skipping the buffered file object entirely.
+
+    An existing file with identical contents is not rewritten, keeping its
+    mtime (and any bundler cache keyed on it) intact.
+    '''
+    if _same_contents(path, data):
+        return
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
-    print("Creating OnRamp frontend with file-based navigation...")
+def write_project_files(project_dir: Path, files: dict):
+    '''Write rendered files in one pass; their directories already exist (PROJECT_DIRS).'''
+    root = os.fspath(project_dir)  # plain strings: no PurePath per file
+    for rel_path, data in files.items():
+        _write_bytes(os.path.join(root, rel_path), data)
 
-    # Create all files
-    create_package_json(app_name, project_dir)
-    create_babel_config(project_dir)
-    create_metro_config(project_dir)    # Native only
-    create_webpack_config(project_dir)  # Web only
-    create_app_json(project_dir, app_name)
-    create_web_index_html(project_dir)  # For Webpack
-    create_web_entry(project_dir)       # For Webpack
-    create_typescript_config(project_dir)
-    create_readme(project_dir, app_name)
 
-    # Copy navigation templates
-    copy_navigation_templates(project_dir)
+def _extract_tarball(tarball: Path, dest: Path):
+    with tarfile.open(tarball) as tf:
+        if hasattr(tarfile, "data_filter"):
+            tf.extractall(dest, filter="data")
+        else:
+            tf.extractall(dest)
+
+
+def extract_node_modules(tarball: Path, project_dir: Path) -> bool:
+    '''Populate project_dir/node_modules from a prebuilt archive.
+
+    The archive must contain a top-level node_modules/ directory (any
+    compression tarfile understands). Returns False if it can't be used,
+    in which case the caller falls back to npm.
+    '''
+    tarball = Path(tarball)
+    if not tarball.is_file():
+        print(f"⚠️  node_modules archive not found: {tarball}")
+        return False
+    print(f"Extracting node_modules from {tarball}")
+    try:
+        _extract_tarball(tarball, project_dir)
+    except (tarfile.TarError, OSError) as e:
+        print(f"⚠️  Could not extract {tarball}: {e}")
+        return False
+    return (project_dir / "node_modules").is_dir()
+
+
+# Finished projects (node_modules included) are cached here, keyed by app name,
+# package manager and onramp version, so repeating `onramp new` is just an unpack.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "onramp"
+
+# Cached projects kept in CACHE_DIR; the least recently written go first
+CACHE_MAX_ENTRIES = 8
 
-    # Create app structure and components
-    create_app_structure(project_dir)
-    create_app_component(project_dir)
-    create_index_files(project_dir, app_name)  # For React Native
 
-    # Copy static assets
-    copy_static_assets(project_dir)
+def _template_version():
+    """The installed onramp version, or None for a source checkout (whose
+    templates can change without the version changing)."""
+    try:
+        return importlib.metadata.version("onramp")
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+def _cache_key(app_name: str, template_version: str, package_manager: str = "npm",
+               features: frozenset = frozenset()) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    for part in (app_name, template_version, package_manager, *sorted(features)):
+        h.update(part.encode("utf-8") + b"\0")
+    return h.hexdigest()
+
+
+def _cache_path(cache_key: str) -> Path:
+    return CACHE_DIR / (cache_key + ".tar.gz")
+
+
+def restore_cached_project(cache_file: Path, project_dir: Path) -> bool:
+    if not cache_file.is_file():
+        return False
+    print(f"Restoring cached project from {cache_file}")
+    try:
+        _extract_tarball(cache_file, project_dir)
+    except (tarfile.TarError, OSError) as e:
+        print(f"⚠️  Ignoring unusable cache entry {cache_file}: {e}")
+        return False
+    return (project_dir / "package.json").exists()
+
+
+def _without_node_modules(info: tarfile.TarInfo):
+    # Names look like "./node_modules/..."; Path drops the leading "."
+    return None if Path(info.name).parts[:1] == ("node_modules",) else info
+
+
+def save_cached_project(cache_file: Path, project_dir: Path):
+    """Archive project_dir, minus node_modules, into the cache and prune the
+    oldest entries; a failure only costs the next run its speedup."""
+    tmp = None
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write under a temporary name so a concurrent or interrupted run
+        # never sees a half-written archive.
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f, tarfile.open(fileobj=f, mode="w:gz") as tf:
+            tf.add(project_dir, arcname=".", filter=_without_node_modules)
+        os.replace(tmp, cache_file)
+        entries = sorted(cache_file.parent.glob("*.tar.gz"), key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in entries[CACHE_MAX_ENTRIES:]:
+            old.unlink(missing_ok=True)
+    except (tarfile.TarError, OSError) as e:
+        print(f"Warning: could not cache project: {e}")
+        if tmp and os.path.exists(tmp):
+            os.unlink(tmp)
+
+
+def create_react_native_app(app_name: str, output_dir: str = ".", node_modules_tarball=None,
+                            package_manager: str = "npm", use_cache: bool = False,
+                            node_modules_cache=None, features=frozenset()):
+    """Create a React Native app with separate web and native bundling.
+
+    If node_modules_tarball points at an archive of a previously installed
+    node_modules, it is unpacked instead of running the install step.
+    package_manager is one of "npm" (the default), "pnpm" or "yarn"; the CLI's
+    native and deploy steps (netlify.toml, React Native CLI deps) assume npm.
+    With use_cache, the project files of a previous run for the same app name
+    are restored from CACHE_DIR instead of being written again (dependencies
+    are still installed); this needs an installed onramp release, since a
+    source checkout has no version to key on. node_modules_cache names
+    a directory of installed node_modules trees keyed by package.json; a hit
+    is hardlinked into the project instead of installing.
+    features selects optional extras from FEATURES ("tests", "prettier").
+    """
+
+    require_node()
+
+    project_dir = Path(output_dir) / app_name / "build"
+    features = frozenset(features)
+    unknown = features - FEATURES.keys()
+    if unknown:
+        raise ValueError(f"Unknown feature(s): {', '.join(sorted(unknown))}")
+    template_version = _template_version()
+    if use_cache and template_version is None:
+        print("Project cache needs an installed onramp release; building from scratch")
+        use_cache = False
+    cache_file = (_cache_path(_cache_key(app_name, template_version, package_manager, features))
+                  if use_cache else None)
+
+    # Fail before writing anything if the install step can't possibly run
+    if not shutil.which(package_manager):
+        print(f"ERROR: {package_manager} not found on PATH. Install Node.js (which ships npm) "
+              f"or pick another --package-manager.")
+        return
+
+    if not (cache_file is not None and restore_cached_project(cache_file, project_dir)):
+        make_project_dirs(project_dir)
+
+        print("Creating OnRamp frontend with file-based navigation...")
+
+        # These touch disjoint files and every directory they need exists already,
+        # so run them side by side to overlap their syscall latency.
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            steps = [
+                # Static scaffold (webpack/metro/babel configs, entry points, starter pages)
+                pool.submit(copy_scaffold, project_dir),
+                # Files that depend on the app name
+                pool.submit(write_project_files, project_dir, render_project_files(app_name, package_manager, features)),
+                pool.submit(copy_static_assets, project_dir),
+            ]
+            for step in steps:
+                step.result()  # re-raise any failure here
 
     # Install dependencies
+    install_cmd = INSTALL_COMMANDS[package_manager]
     try:
         # Scrub ~/.npmrc pitfalls before install
         npmrc = Path.home() / ".npmrc"
@@ -834,25 +757,43 @@ def create_react_native_app(app_name: str, output_dir: str = "."):
                 pass
             return
 
-        run_command("npm install --legacy-peer-deps", cwd=project_dir)
-    except subprocess.CalledProcessError:
+        install_hash = _install_hash(project_dir, package_manager)
+        if _install_is_current(project_dir, install_hash):
+            print("Dependencies already installed for this package.json and lockfile — skipping install")
+        elif node_modules_cache and link_cached_node_modules(node_modules_cache, install_hash, project_dir):
+            _write_install_stamp(project_dir, install_hash)
+        elif not (node_modules_tarball and extract_node_modules(node_modules_tarball, project_dir)):
+            run_command(install_cmd, cwd=project_dir, capture=False)
+            # The install may have written or updated the lockfile
+            _write_install_stamp(project_dir, _install_hash(project_dir, package_manager))
+            if node_modules_cache:
+                store_node_modules(node_modules_cache, install_hash, project_dir)
+    except (subprocess.CalledProcessError, FileNotFoundError):
         print("⚠️  Installation failed. Please run manually:")
-        print(f"   cd {app_name}/build && npm install --legacy-peer-deps")
+        print(f"   cd {app_name}/build && {' '.join(install_cmd)}")
         return
 
     # Generate initial routes (safe no-op if script missing)
-    scripts_dir = project_dir / "scripts"
-    build_script = scripts_dir / "build-routes.js"
+    build_script = project_dir / "scripts" / "build-routes.js"
     if build_script.exists():
         try:
-            run_command("node scripts/build-routes.js", cwd=project_dir)
+            run_command(["node", "scripts/build-routes.js"], cwd=project_dir)
         except subprocess.CalledProcessError:
             print("⚠️  Could not generate initial routes")
 
-    print("OnRamp frontend created!\n")
-    print("Commands:")
-    print(f"  cd {app_name}/build")
-    print("  npm run start:native  # Start native development (Metro)")
-    print("  npm run start:web     # Start web development (Webpack)")
-    print("  npm run android       # Run Android app")
-    print("  npm run ios           # Run iOS app")
\ No newline at end of file
+    if cache_file is not None:
+        save_cached_project(cache_file, project_dir)
+
+    _print_next_steps(app_name)
+
+
+def _print_next_steps(app_name: str):
+    sys.stdout.write(
+        "OnRamp frontend created!\n\n"
+        "Commands:\n"
+        f"  cd {app_name}/build\n"
+        "  npm run start:native  # Start native development (Metro)\n"
+        "  npm run start:web     # Start web development (Webpack)\n"
+        "  npm run android       # Run Android app\n"
+        "  npm run ios           # Run iOS app\n"
+    )
\ No newline at end of file
@@ -0,0 +1,16 @@
+import React from 'react';
+import { NavigationProvider, useNavigation } from './src/navigation/NavigationProvider';
+import { RouteComponent } from './src/navigation/RouteRegistry';
+
+function AppContent() {
+  const { currentRoute, params } = useNavigation();
+  return <RouteComponent path={currentRoute} params={params} />;
+}
+
+export default function App() {
+  return (
+    <NavigationProvider initialRoute="/">
+      <AppContent />
+    </NavigationProvider>
+  );
+}
@@ -0,0 +1,40 @@
+import React from 'react';
+import { html } from 'react-strict-dom';
+import { useNavigation } from '../../src/navigation/NavigationProvider';
+import { buttonStyles } from '../../src/styles/buttons';
+
+export default function ProfilePage({ id }) {
+  const { navigate, goBack, canGoBack } = useNavigation();
+
+  return (
+    <html.div style={{
+      padding: 20,
+      fontFamily: 'system-ui, -apple-system, sans-serif',
+      flex: 1,
+      backgroundColor: '#f5f5f5'
+    }as any}>
+      <html.div style={{
+        backgroundColor: 'white',
+        padding: 30,
+        borderRadius: 12,
+        boxShadow: '0 2px 8px rgba(0,0,0,0.1)',
+        maxWidth: 600
+      }as any}>
+        <html.h1 style={{ color: '#333', marginBottom: 16 }}>Profile Page</html.h1>
+        <html.p style={{ color: '#666', marginBottom: 20 }}>Profile ID: {id || 'No ID provided'}</html.p>
+        <html.div style={{ display: 'flex', gap: 10 }}>
+          {canGoBack() && (
+            <html.button 
+              onClick={goBack}
+              style={buttonStyles.secondary}
+            >Go Back</html.button>
+          )}
+          <html.button 
+            onClick={() => navigate('/')}
+            style={buttonStyles.primary}
+          >Home</html.button>
+        </html.div>
+      </html.div>
+    </html.div>
+  );
+}
@@ -0,0 +1,5 @@
+module.exports = {
+  // Metro (native) only
+  presets: ['module:@react-native/babel-preset'],
+  plugins: ['@stylexjs/babel-plugin'],
+};
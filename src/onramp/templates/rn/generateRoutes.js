@@ -123,10 +123,11 @@ function resolvePlatformFile(variants, platform) {
 function scanApp(appDir) {
   const all = [];
   const walk = dir => {
-    for (const name of fs.readdirSync(dir)) {
+    // withFileTypes gives us the entry type from readdir itself, no stat per file
+    for (const entry of fs.readdirSync(dir, { withFileTypes: true })) {
+      const name = entry.name;
       const full = path.join(dir, name);
-      const stat = fs.statSync(full);
-      if (stat.isDirectory()) {
+      if (entry.isDirectory()) {
         walk(full);
       } else if (isPageFile(name)) {
         // Store path relative to app/
@@ -244,6 +245,17 @@ function generateRoutesConfig() {
       .join('\n') +
     `\n};\n`;
 
+  // Routes only depend on which files exist, so most runs produce the same
+  // output. Leave the file untouched then, so watchers don't rebuild for nothing.
+  let previous = null;
+  try {
+    previous = fs.readFileSync(outFile, 'utf8');
+  } catch (e) { /* first run */ }
+  if (previous === file) {
+    console.log(`Routes unchanged (src/generated/routes.ts)`);
+    return;
+  }
+
   fs.writeFileSync(outFile, file, 'utf8');
   console.log(`Generated routes configuration at src/generated/routes.ts`);
   console.log(`Found ${routes.length} routes`);
@@ -0,0 +1,9 @@
+// Shared button styles for the starter pages. Plain style objects, created
+// once at module load instead of on every render.
+const base = { padding: '10px 20px', color: 'white', border: 'none', borderRadius: 6, cursor: 'pointer' };
+
+export const buttonStyles = {
+  primary: { ...base, backgroundColor: '#007AFF' } as any,
+  secondary: { ...base, backgroundColor: '#666' } as any,
+  success: { ...base, backgroundColor: '#34C759' } as any,
+};
@@ -0,0 +1,130 @@
+const os = require('os');
+const path = require('path');
+const HtmlWebpackPlugin = require('html-webpack-plugin');
+const MiniCssExtractPlugin = require('mini-css-extract-plugin');
+
+// `webpack --mode production` (npm run build:web) or NODE_ENV=production
+module.exports = (env, argv = {}) => {
+  const isProd = argv.mode === 'production' || process.env.NODE_ENV === 'production';
+
+  // Browsers with native ES modules; React 19/RSDOM don't run on anything older
+  const envPreset = ['@babel/preset-env', { targets: { esmodules: true }, bugfixes: true }];
+  const reactPreset = ['@babel/preset-react', { runtime: 'automatic' }];
+  const tsPreset = ['@babel/preset-typescript'];
+  const rsdPreset = ['react-strict-dom/babel-preset', { platform: 'web' }];
+  const stylexPlugin = ['@stylexjs/babel-plugin', {
+    dev: !isProd,
+    runtimeInjection: false,
+    genConditionalClasses: true,
+    treeshakeCompensation: true,
+    unstable_moduleResolution: { type: 'commonJS', rootDir: __dirname }
+  }];
+
+  // Run babel in a pool of worker processes. The dev server keeps the pool
+  // alive between rebuilds; one-off builds let it exit so the process can end.
+  const threadLoader = {
+    loader: 'thread-loader',
+    options: {
+      workers: Math.max(1, os.cpus().length - 1),
+      workerParallelJobs: 50,
+      poolTimeout: process.env.WEBPACK_SERVE ? Infinity : 2000,
+    }
+  };
+
+  // Use only these options for web (avoid metro config bleed-through)
+  const babelLoader = (presets) => [threadLoader, {
+    loader: 'babel-loader',
+    options: {
+      babelrc: false,
+      configFile: false,
+      cacheDirectory: true,
+      cacheCompression: false,
+      presets,
+      plugins: [stylexPlugin]
+    }
+  }];
+
+  return {
+    entry: './index.web.js',
+    mode: isProd ? 'production' : 'development',
+    // Persist the module graph between runs; rebuilt when this file changes
+    cache: {
+      type: 'filesystem',
+      buildDependencies: { config: [__filename] },
+      cacheDirectory: path.resolve(__dirname, 'node_modules/.cache/webpack'),
+    },
+    // Trust package versions in node_modules instead of stat-ing every file
+    snapshot: { managedPaths: [path.resolve(__dirname, 'node_modules')] },
+    // Dev rebuilds reuse in-memory results for modules the change can't affect
+    experiments: { cacheUnaffected: true },
+    devServer: {
+      port: 'auto',
+      historyApiFallback: true,
+      static: { directory: path.join(__dirname, 'assets') },
+    },
+    module: {
+      rules: [
+        // App code only; everything else in node_modules ships prebuilt
+        {
+          test: /\.(js|jsx|ts|tsx)$/,
+          include: [
+            path.resolve(__dirname, 'src'),
+            path.resolve(__dirname, 'app'),
+            path.resolve(__dirname, 'App.jsx'),
+            path.resolve(__dirname, 'index.web.js'),
+          ],
+          use: babelLoader([envPreset, reactPreset, tsPreset, rsdPreset]),
+        },
+        // Transpile react-strict-dom itself for web
+        {
+          test: /\.(js|jsx|ts|tsx)$/,
+          include: /node_modules[\/]react-strict-dom/,
+          use: babelLoader([envPreset, reactPreset, rsdPreset]),
+        },
+        // Plain stylesheets load as real CSS files, in parallel with the JS
+        {
+          test: /\.css$/,
+          use: [MiniCssExtractPlugin.loader, 'css-loader'],
+          sideEffects: true,
+        }
+      ]
+    },
+    resolve: {
+      // .web.* stays: RN-ecosystem packages ship web-specific files that way
+      extensions: ['.web.js','.web.jsx','.web.ts','.web.tsx','.js','.jsx','.ts','.tsx'],
+      // node_modules is hoisted (see the pnpm/yarn config), so there are no
+      // symlinks worth resolving
+      symlinks: false,
+      cacheWithContext: false,
+      alias: { 'react-native$': 'react-strict-dom' }
+    },
+    optimization: {
+      usedExports: true,
+      sideEffects: true,
+      concatenateModules: isProd,
+      // Stable ids so an app-code change doesn't rename the vendor chunk
+      moduleIds: 'deterministic',
+      chunkIds: 'deterministic',
+      splitChunks: {
+        chunks: 'all',
+        cacheGroups: {
+          defaultVendors: { test: /[\\/]node_modules[\\/]/, name: 'vendors', priority: -10, reuseExistingChunk: true },
+          default: { minChunks: 2, priority: -20, reuseExistingChunk: true }
+        }
+      },
+      runtimeChunk: 'single'
+    },
+    plugins: [
+      new HtmlWebpackPlugin({ template: 'index.html', inject: true }),
+      new MiniCssExtractPlugin({ filename: isProd ? '[name].[contenthash:8].css' : '[name].css' }),
+    ],
+    output: {
+      path: path.resolve(__dirname, 'dist'),
+      // Several chunks now; hash them in production so they cache forever
+      filename: isProd ? '[name].[contenthash:8].js' : '[name].js',
+      chunkFilename: isProd ? '[name].[contenthash:8].chunk.js' : '[name].chunk.js',
+      publicPath: '/',
+      clean: true
+    }
+  };
+};
@@ -0,0 +1,271 @@
+import importlib
+import os
+import textwrap
+
+import pytest
+from starlette.testclient import TestClient
+
+
+@pytest.fixture
+def onramp_app(tmp_path, monkeypatch):
+    """The onramp.app module, first imported from an empty directory.
+
+    Importing it builds the default app for the current directory, which
+    creates a db/ folder there.
+    """
+    monkeypatch.chdir(tmp_path)
+    return importlib.import_module("onramp.app")
+
+
+@pytest.fixture
+def make_app(onramp_app, tmp_path):
+    """Build an OnRamp app from route files given as {filename: source}."""
+    OnRamp = onramp_app.OnRamp
+
+    def make(files):
+        api_dir = tmp_path / "api"
+        api_dir.mkdir(exist_ok=True)
+        for name, source in files.items():
+            (api_dir / name).write_text(textwrap.dedent(source))
+        onramp = OnRamp(app_dir=str(tmp_path))
+        return onramp, onramp.create_app()
+    return make
+
+
+def test_sync_handlers_survive_repeated_lifespans(make_app):
+    """A second lifespan on the same app gets a fresh thread pool."""
+    onramp, app = make_app({"work.py": """
+        def get():
+            return {"ok": True}
+    """})
+
+    for _ in range(2):
+        with TestClient(app) as client:
+            response = client.get("/api/work")
+            assert response.status_code == 200
+            assert response.json() == {"ok": True}
+        assert onramp._executor is None
+
+
+def test_sync_handler_without_lifespan(make_app):
+    """Sync handlers work when the server never sends lifespan events."""
+    _, app = make_app({"work.py": """
+        def get(request):
+            return request.query_params["q"]
+    """})
+
+    response = TestClient(app).get("/api/work?q=hi")
+    assert response.status_code == 200
+    assert response.text == "hi"
+
+
+def test_json_responses_use_the_stdlib_encoder(make_app):
+    """JSON output and errors match Starlette's JSONResponse, whatever else is installed."""
+    _, app = make_app({
+        "data.py": """
+            def get():
+                return {"name": "caf\\u00e9", "n": 1, "items": [1.5, None, True], 2: "x"}
+        """,
+        "nan.py": """
+            def get():
+                return {"value": float("nan")}
+        """,
+        "uid.py": """
+            import uuid
+
+            def get():
+                return {"id": uuid.UUID(int=0)}
+        """,
+    })
+    client = TestClient(app, raise_server_exceptions=False)
+
+    response = client.get("/api/data")
+    assert response.status_code == 200
+    assert response.content == '{"name":"café","n":1,"items":[1.5,null,true],"2":"x"}'.encode()
+
+    assert client.get("/api/nan").status_code == 500
+    assert client.get("/api/uid").status_code == 500
+
+
+def test_path_params_reach_handlers(make_app):
+    """Two-argument handlers get the path params; others can read them off the request."""
+    _, app = make_app({
+        "[id].py": """
+            from onramp.app import fast
+
+            def get(request, params):
+                return {"id": params["id"]}
+
+            async def put(request, params):
+                return {"id": params["id"], "method": "PUT"}
+
+            @fast
+            def patch(request, params):
+                return {"id": params["id"], "method": "PATCH"}
+
+            def delete(request):
+                return {"id": request.path_params["id"]}
+        """,
+    })
+    client = TestClient(app)
+
+    assert client.get("/api/42").json() == {"id": "42"}
+    assert client.put("/api/42").json() == {"id": "42", "method": "PUT"}
+    assert client.patch("/api/42").json() == {"id": "42", "method": "PATCH"}
+    assert client.delete("/api/42").json() == {"id": "42"}
+
+
+def test_head_falls_back_to_get(make_app):
+    """HEAD is answered by get() unless the file defines head(), always without a body."""
+    _, app = make_app({
+        "page.py": """
+            def get():
+                return {"hello": "world"}
+        """,
+        "custom.py": """
+            def get():
+                return "from get"
+
+            def head(request):
+                from starlette.responses import Response
+                return Response(headers={"x-handler": "head"})
+        """,
+        "write.py": """
+            def post():
+                return "posted"
+        """,
+    })
+    client = TestClient(app)
+
+    get = client.get("/api/page")
+    head = client.head("/api/page")
+    assert head.status_code == 200
+    assert head.content == b""
+    assert head.headers["content-type"] == get.headers["content-type"]
+    assert head.headers["content-length"] == get.headers["content-length"]
+
+    custom = client.head("/api/custom")
+    assert custom.headers["x-handler"] == "head"
+    assert custom.content == b""
+
+    assert client.head("/api/write").status_code == 405
+
+
+def test_route_modules_reused_until_edited(make_app, onramp_app, tmp_path):
+    """A route file runs once per version; an edit replaces its cache entry."""
+    route = tmp_path / "api" / "counted.py"
+    runs = tmp_path / "runs.txt"
+    source = f"""
+        with open({str(runs)!r}, "a") as f:
+            f.write("x")
+
+        def get():
+            return VERSION
+
+        VERSION = __VERSION__
+    """
+    make_app({"counted.py": source.replace("__VERSION__", "1")})
+    _, app = make_app({})
+    assert runs.read_text() == "x"
+    assert TestClient(app).get("/api/counted").json() == 1
+
+    route.write_text(textwrap.dedent(source.replace("__VERSION__", "2")))
+    os.utime(route, ns=(0, route.stat().st_mtime_ns + 1))
+    _, app = make_app({})
+    assert runs.read_text() == "xx"
+    assert TestClient(app).get("/api/counted").json() == 2
+    mtime_ns, module = onramp_app._ROUTE_MODULES[str(route)]
+    assert mtime_ns == route.stat().st_mtime_ns
+    assert module.VERSION == 2
+
+
+def test_unhashable_callable_handler(make_app):
+    """Handlers only need to be callable, not hashable."""
+    _, app = make_app({"obj.py": """
+        class Handler:
+            __hash__ = None
+
+            def __call__(self, request):
+                return {"path": request.url.path}
+
+        get = Handler()
+    """})
+
+    assert TestClient(app).get("/api/obj").json() == {"path": "/api/obj"}
+
+
+def test_param_count(onramp_app):
+    """The code-object fast path agrees with inspect.signature."""
+    import functools
+
+    def none():
+        pass
+
+    def one(request):
+        pass
+
+    def two(request, params=None):
+        pass
+
+    def star(*args, **kwargs):
+        pass
+
+    @functools.wraps(one)
+    def wrapped(*args):
+        pass
+
+    for func, expected in [(none, 0), (one, 1), (two, 2), (star, 2), (wrapped, 1)]:
+        assert onramp_app._param_count(func) == expected
+
+
+def test_string_results_html_or_text(make_app):
+    """Strings wrapped in tags, ignoring outer whitespace, are served as HTML."""
+    _, app = make_app({"page.py": """
+        def get(request):
+            return request.query_params["body"]
+    """})
+    client = TestClient(app)
+
+    for body, content_type in [("<b>hi</b>", "text/html"), ("\n  <p>x</p>\n", "text/html"),
+                               ("<", "text/plain"), ("a <b>", "text/plain"), ("  ", "text/plain")]:
+        response = client.get("/api/page", params={"body": body})
+        assert response.headers["content-type"].startswith(content_type), body
+        assert response.text == body
+
+
+def test_static_routes_registered_before_dynamic(make_app):
+    """/api/{id} never shadows a static route file, whatever the directory order."""
+    onramp, app = make_app({
+        "[id].py": """
+            def get(request, params):
+                return {"id": params["id"]}
+        """,
+        "users.py": """
+            def get():
+                return "users"
+        """,
+        "about.py": """
+            def get():
+                return "about"
+        """,
+    })
+    client = TestClient(app)
+
+    assert [route.path for route in onramp.routes] == ["/api/about", "/api/users", "/api/{id}"]
+    assert client.get("/api/users").text == "users"
+    assert client.get("/api/7").json() == {"id": "7"}
+
+
+def test_method_not_allowed_lists_every_method(make_app):
+    """A 405 names all methods the route file handles."""
+    _, app = make_app({"items.py": """
+        def get():
+            return []
+
+        def post():
+            return {}
+    """})
+
+    response = TestClient(app).put("/api/items")
+    assert response.status_code == 405
+    assert set(response.headers["allow"].split(", ")) == {"GET", "HEAD", "POST"}
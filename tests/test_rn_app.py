@@ -0,0 +1,194 @@
+import json
+import os
+import shutil
+import tarfile
+import textwrap
+import time
+
+import pytest
+
+from onramp import rn_app
+
+
+@pytest.fixture
+def fake_node(tmp_path, monkeypatch):
+    """Put fake node and npm scripts on PATH and work in an empty directory.
+
+    npm install creates node_modules and, if missing, package-lock.json.
+    Returns a function listing the commands run so far.
+    """
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "commands.log"
+    scripts = {
+        "node": f"""
+            #!/bin/sh
+            echo "node $*" >> "{log}"
+            if [ "$1" = "-v" ]; then echo v20.19.4; fi
+        """,
+        "npm": f"""
+            #!/bin/sh
+            echo "npm $*" >> "{log}"
+            mkdir -p node_modules
+            [ -f package-lock.json ] || echo '{{"lockfileVersion": 3}}' > package-lock.json
+        """,
+    }
+    for name, script in scripts.items():
+        path = bin_dir / name
+        path.write_text(textwrap.dedent(script).lstrip())
+        path.chmod(0o755)
+
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setattr(rn_app, "CACHE_DIR", tmp_path / "cache")
+    rn_app._executable.cache_clear()
+    rn_app._probe_node_version.cache_clear()
+    work = tmp_path / "work"
+    work.mkdir()
+    monkeypatch.chdir(work)
+
+    def commands():
+        return log.read_text().splitlines() if log.exists() else []
+    yield commands
+    rn_app._executable.cache_clear()
+    rn_app._probe_node_version.cache_clear()
+
+
+def npm_installs(commands):
+    return [c for c in commands() if c.startswith("npm install")]
+
+
+def test_render_project_files_app_name():
+    """app.json gets a JSON-escaped name, README.md the name as written."""
+    app_name = 'Café "Q" \\ app'
+    files = rn_app.render_project_files(app_name, "npm")
+
+    app_json = json.loads(files["app.json"])
+    assert app_json == {"name": app_name, "displayName": app_name}
+    assert files["app.json"] == json.dumps(app_json, indent=2).encode("utf-8")
+    assert files["README.md"].startswith(f"# {app_name}\n".encode("utf-8"))
+
+
+def test_install_skipped_until_lockfile_changes(fake_node):
+    """The install stamp covers package.json and the lockfile the install wrote."""
+    rn_app.create_react_native_app("demo")
+    build = os.path.join("demo", "build")
+    assert len(npm_installs(fake_node)) == 1
+    assert os.path.exists(os.path.join(build, rn_app.INSTALL_STAMP))
+
+    rn_app.create_react_native_app("demo")
+    assert len(npm_installs(fake_node)) == 1
+
+    with open(os.path.join(build, "package-lock.json"), "a") as f:
+        f.write("\n")
+    rn_app.create_react_native_app("demo")
+    assert len(npm_installs(fake_node)) == 2
+
+
+def test_project_cache_is_opt_in(fake_node):
+    """Without use_cache nothing is read from or written to CACHE_DIR."""
+    rn_app.create_react_native_app("demo")
+    assert not rn_app.CACHE_DIR.exists()
+
+
+def test_project_cache_skipped_for_source_checkout(fake_node, monkeypatch, capsys):
+    """A checkout without a package version has nothing to key the cache on."""
+    monkeypatch.setattr(rn_app, "_template_version", lambda: None)
+    rn_app.create_react_native_app("demo", use_cache=True)
+    assert "building from scratch" in capsys.readouterr().out
+    assert not rn_app.CACHE_DIR.exists()
+
+
+def test_project_cache_restores_files_but_not_node_modules(fake_node, monkeypatch, capsys):
+    """A cached project is restored without node_modules, so dependencies are installed again."""
+    monkeypatch.setattr(rn_app, "_template_version", lambda: "1.0")
+    rn_app.create_react_native_app("demo", use_cache=True)
+    (archive,) = rn_app.CACHE_DIR.glob("*.tar.gz")
+    with tarfile.open(archive) as tf:
+        names = tf.getnames()
+    assert "./package.json" in names
+    assert not [n for n in names if "node_modules" in n]
+
+    shutil.rmtree("demo")
+    capsys.readouterr()
+    rn_app.create_react_native_app("demo", use_cache=True)
+    out = capsys.readouterr().out
+    assert "Restoring cached project" in out
+    assert "Creating OnRamp frontend" not in out
+    assert os.path.exists(os.path.join("demo", "build", "package.json"))
+    assert len(npm_installs(fake_node)) == 2
+
+
+def test_project_cache_evicts_oldest(fake_node, monkeypatch):
+    """Only the newest CACHE_MAX_ENTRIES archives are kept."""
+    monkeypatch.setattr(rn_app, "_template_version", lambda: "1.0")
+    monkeypatch.setattr(rn_app, "CACHE_MAX_ENTRIES", 2)
+    rn_app.CACHE_DIR.mkdir()
+    for age, name in [(300, "oldest"), (200, "older")]:
+        old = rn_app.CACHE_DIR / f"{name}.tar.gz"
+        old.write_bytes(b"")
+        os.utime(old, (time.time() - age, time.time() - age))
+
+    rn_app.create_react_native_app("demo", use_cache=True)
+    kept = sorted(p.name for p in rn_app.CACHE_DIR.glob("*.tar.gz"))
+    assert kept == sorted(["older.tar.gz", rn_app._cache_path(rn_app._cache_key("demo", "1.0")).name])
+
+
+def test_cache_key_covers_every_input():
+    """App name, onramp version, package manager and features each change the key."""
+    base = rn_app._cache_key("demo", "1.0", "npm", frozenset())
+    variants = [
+        rn_app._cache_key("other", "1.0", "npm", frozenset()),
+        rn_app._cache_key("demo", "1.1", "npm", frozenset()),
+        rn_app._cache_key("demo", "1.0", "pnpm", frozenset()),
+        rn_app._cache_key("demo", "1.0", "npm", frozenset({"tests"})),
+    ]
+    assert len({base, *variants}) == 5
+    assert rn_app._cache_key("demo", "1.0", "npm", frozenset({"tests", "prettier"})) == \
+        rn_app._cache_key("demo", "1.0", "npm", frozenset({"prettier", "tests"}))
+
+
+def test_install_hash_tracks_dependency_fields(tmp_path):
+    """Only dependency fields and the package manager change the install hash."""
+    def install_hash(package_manager="npm", **changes):
+        data = {"name": "demo", "scripts": {"start": "x"}, "dependencies": {"react": "19.1.0"}}
+        data.update(changes)
+        (tmp_path / "package.json").write_text(json.dumps(data))
+        return rn_app._install_hash(tmp_path, package_manager)
+
+    base = install_hash()
+    assert install_hash(name="other", scripts={}) == base
+    assert install_hash(dependencies={"react": "19.1.1"}) != base
+    assert install_hash(devDependencies={"jest": "29.7.0"}) != base
+    assert install_hash("pnpm") != base
+
+
+def test_install_skipped_when_stamp_matches(fake_node, capsys):
+    """A matching stamp skips the install; deleting node_modules drops the stamp with it."""
+    rn_app.create_react_native_app("demo")
+    rn_app.create_react_native_app("demo")
+    assert "skipping install" in capsys.readouterr().out
+    assert len(npm_installs(fake_node)) == 1
+
+    shutil.rmtree(os.path.join("demo", "build", "node_modules"))
+    rn_app.create_react_native_app("demo")
+    assert len(npm_installs(fake_node)) == 2
+
+
+def test_write_bytes_skips_identical_contents(tmp_path):
+    """Unchanged files keep their mtime; changed ones are rewritten."""
+    path = str(tmp_path / "file.txt")
+    rn_app._write_bytes(path, b"hello")
+    os.utime(path, ns=(0, 0))
+
+    rn_app._write_bytes(path, b"hello")
+    assert os.stat(path).st_mtime_ns == 0
+
+    rn_app._write_bytes(path, b"hellO")
+    assert os.stat(path).st_mtime_ns != 0
+    with open(path, "rb") as f:
+        assert f.read() == b"hellO"
+
+    rn_app._write_bytes(path, b"hi")
+    with open(path, "rb") as f:
+        assert f.read() == b"hi"